@@ -0,0 +1,343 @@
+"""Per-call overhead of the decorators
+
+Measures how many nanoseconds each decorator adds to a call, compared with
+the same function undecorated, the hit and miss paths of the caches, the
+cost of a call when several threads call at once, and the memory used by
+each cached entry. Output printed by the decorators is discarded while
+measuring.
+
+Run from the root of the repository:
+
+    python -m benchmarks.overhead --output baseline.json
+    python -m benchmarks.overhead --compare baseline.json --threshold 0.25
+
+--compare exits with status 1 when a result got worse than the baseline by
+more than the threshold, so it can gate a change. Results that touch the
+disk (diskCache) or depend on thread scheduling (contention) vary more
+from run to run than the others, compare runs made on the same machine.
+"""
+
+import argparse
+import contextlib
+import gc
+import itertools
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import warnings
+
+from decorators import (Range, alphabeticalOutput, compose, deprecated,
+                        diskCache, exponentialBackoff, log, memoize,
+                        rateLimit, retry, singleton, timeout, timer,
+                        type_check, validate)
+from decorators._log import flush
+
+
+# Fewer calls for the decorators that cost microseconds or more per call
+_SLOW = 100
+_VERY_SLOW = 10_000
+
+# First argument of the next "distinct" loop, so misses stay misses
+_nextArgument = 0
+
+
+def _arguments(number: int, distinct: bool):
+    global _nextArgument
+    if not distinct:
+        return itertools.repeat(0, number)
+    start = _nextArgument
+    _nextArgument += number
+    return range(start, start + number)
+
+
+def _loop(func: callable, number: int, distinct: bool) -> float:
+    """Time number calls of func, in nanoseconds per call"""
+    arguments = _arguments(number, distinct)
+    start = time.perf_counter_ns()
+    for argument in arguments:
+        func(argument)
+    return (time.perf_counter_ns() - start) / number
+
+
+def _best(func: callable, number: int, repeat: int, distinct: bool) -> float:
+    # The fastest run is the one least disturbed by the rest of the system
+    gc.disable()
+    try:
+        return min(_loop(func, number, distinct) for _ in range(repeat))
+    finally:
+        gc.enable()
+        flush()
+
+
+def _threaded(func: callable, number: int, threads: int,
+              distinct: bool) -> float:
+    """Time number calls of func in each thread, in nanoseconds per call"""
+    barrier = threading.Barrier(threads + 1)
+    arguments = [_arguments(number, distinct) for _ in range(threads)]
+
+    def run(arguments) -> None:
+        barrier.wait()
+        for argument in arguments:
+            func(argument)
+
+    workers = [threading.Thread(target=run, args=(a,)) for a in arguments]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter_ns()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter_ns() - start
+    flush()
+    return elapsed / (number * threads)
+
+
+def _cases(directory: str) -> list:
+    """
+    Cases to measure: (name, decorated, undecorated, distinct, scale)
+
+    distinct cases get a new argument on every call, scale divides the
+    number of calls.
+    """
+    logger = logging.getLogger("benchmarks.overhead")
+    logger.addHandler(logging.NullHandler())
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    def identity(x):
+        return x
+
+    def letters(x):
+        return ["c", "a", "b", "e", "d"]
+
+    class Plain:
+        def __init__(self, value=0):
+            self.value = value
+
+    @singleton
+    class Single(Plain):
+        pass
+
+    cached = memoize(identity)
+    cached(0)
+    onDisk = diskCache(os.path.join(directory, "hit"))(identity)
+    onDisk(0)
+
+    def annotated(x: int) -> int:
+        return x
+
+    stacked = log(logger=logger)(validate(x=lambda v: v >= 0)(
+        retry(attempts=3, delay=0)(identity)))
+    fused = compose(log(logger=logger), validate(x=lambda v: v >= 0),
+                    retry(attempts=3, delay=0))(identity)
+
+    return [
+        ("timer", timer(identity), identity, False, 1),
+        ("log", log(logger=logger)(identity), identity, False, 1),
+        ("log_sampled", log(logger=logger, sample_rate=0.01)(identity),
+         identity, False, 1),
+        ("memoize_hit", cached, identity, False, 1),
+        ("memoize_miss", memoize(identity), identity, True, 1),
+        ("diskCache_hit", onDisk, identity, False, _SLOW),
+        ("diskCache_miss", diskCache(os.path.join(directory, "miss"))(
+            identity), identity, True, _SLOW),
+        ("rateLimit", rateLimit(maxCalls=10**9, period=0.01)(identity),
+         identity, False, 1),
+        ("retry", retry(attempts=3, delay=0)(identity), identity, False,
+         1),
+        ("exponentialBackoff", exponentialBackoff()(identity), identity,
+         False, 1),
+        ("validate", validate(x=lambda v: v >= 0)(identity), identity,
+         False, 1),
+        ("validate_constraint", validate(x=Range(0, None))(identity),
+         identity, False, 1),
+        ("type_check", type_check(annotated), annotated, False, 1),
+        ("deprecated", deprecated("benchmark")(identity), identity, False,
+         1),
+        ("singleton", Single, Plain, False, 1),
+        ("alphabeticalOutput", alphabeticalOutput(letters), letters, False,
+         1),
+        ("timeout_thread", timeout(10.0, method="thread")(identity),
+         identity, False, _SLOW),
+        ("timeout_process", timeout(10.0, method="process")(identity),
+         identity, False, _VERY_SLOW),
+        ("stacked_log_validate_retry", stacked, identity, False, 1),
+        ("compose_log_validate_retry", fused, identity, False, 1),
+    ]
+
+
+# Cases that share state between threads (locks, lists, dicts, queues)
+_CONTENDED = ("memoize_hit", "log", "rateLimit", "singleton", "timer")
+
+
+def _memory(entries: int, directory: str) -> dict:
+    """Bytes used by each cached entry"""
+    def identity(x, **kwargs):
+        return x
+
+    results = {}
+    for name, call in (("memoize_args", lambda f, i: f(i)),
+                       ("memoize_kwargs", lambda f, i: f(i, key=i))):
+        cached = memoize(identity)
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(entries):
+            call(cached, i)
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        results[name] = (after - before) / entries
+
+    path = os.path.join(directory, "memory")
+    onDisk = diskCache(path)(identity)
+    count = max(1, entries // _SLOW)
+    for i in range(count):
+        onDisk(i)
+    size = sum(entry.stat().st_size for entry in os.scandir(path))
+    results["diskCache_file"] = size / count
+    return results
+
+
+def run(number: int = 100_000, repeat: int = 5, threads: int = 4) -> dict:
+    """
+    Run every benchmark
+
+    Parameters:
+        number (int): calls per measurement
+        repeat (int): measurements per case, the fastest one is kept
+        threads (int): threads calling at once in the contention benchmarks
+
+    Returns:
+        dict: the results, ready to be saved as JSON
+    """
+    overhead = {}
+    contention = {}
+    with tempfile.TemporaryDirectory() as directory, \
+            open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull), \
+            warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for name, decorated, plain, distinct, scale in _cases(directory):
+            calls = max(1, number // scale)
+            baseline = _best(plain, calls, repeat, distinct)
+            decoratedTime = _best(decorated, calls, repeat, distinct)
+            overhead[name] = {
+                "ns_per_call": round(decoratedTime, 1),
+                "baseline_ns_per_call": round(baseline, 1),
+                "overhead_ns": round(decoratedTime - baseline, 1),
+            }
+            if name in _CONTENDED:
+                contention[name] = {
+                    "threads": threads,
+                    "ns_per_call": round(_threaded(
+                        decorated, calls // threads, threads, distinct), 1),
+                }
+        memory = {name: round(size, 1)
+                  for name, size in _memory(number // 10, directory).items()}
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "number": number,
+        "repeat": repeat,
+        "overhead": overhead,
+        "contention": contention,
+        "memory_bytes_per_entry": memory,
+    }
+
+
+def _flatten(report: dict) -> dict:
+    """Comparable values of a report, lower is better"""
+    values = {}
+    for name, result in report.get("overhead", {}).items():
+        values[f"overhead/{name}"] = result["overhead_ns"]
+    for name, result in report.get("contention", {}).items():
+        values[f"contention/{name}"] = result["ns_per_call"]
+    for name, size in report.get("memory_bytes_per_entry", {}).items():
+        values[f"memory/{name}"] = size
+    return values
+
+
+def compare(baseline: dict, current: dict, threshold: float,
+            minimum: float, minimum_bytes: float = 16.0) -> list:
+    """
+    Find the results that got worse
+
+    A result regresses when it grew by more than threshold (a fraction of
+    the baseline) and by more than a floor, so that a few nanoseconds of
+    noise on a cheap decorator are not reported.
+
+    Parameters:
+        baseline (dict): earlier report
+        current (dict): report to check
+        threshold (float): relative growth reported as a regression
+        minimum (float): floor of the timings, in nanoseconds
+        minimum_bytes (float): floor of the memory results, in bytes
+
+    Returns:
+        list: (name, baseline value, current value) of each regression
+    """
+    old = _flatten(baseline)
+    new = _flatten(current)
+    regressions = []
+    for name in sorted(old.keys() & new.keys()):
+        before, after = old[name], new[name]
+        floor = minimum_bytes if name.startswith("memory/") else minimum
+        if after - before > floor and after > before * (1 + threshold):
+            regressions.append((name, before, after))
+    return regressions
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.overhead",
+        description="Measure the per-call overhead of every decorator.")
+    parser.add_argument("--number", type=int, default=100_000,
+                        help="calls per measurement (default: 100000)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="measurements per case (default: 5)")
+    parser.add_argument("--threads", type=int, default=4,
+                        help="threads in the contention benchmarks")
+    parser.add_argument("--output", help="write the results to this file")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="results to compare with, exit with status 1 "
+                             "on regressions")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative growth reported as a regression "
+                             "(default: 0.25)")
+    parser.add_argument("--min-ns", type=float, default=25.0,
+                        help="smaller growths of the timings are "
+                             "ignored as noise (default: 25)")
+    parser.add_argument("--min-bytes", type=float, default=16.0,
+                        help="smaller growths of the memory results are "
+                             "ignored as noise (default: 16)")
+    args = parser.parse_args(argv)
+
+    report = run(args.number, args.repeat, args.threads)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold, args.min_ns,
+                              args.min_bytes)
+        for name, before, after in regressions:
+            print(f"REGRESSION {name}: {before} -> {after}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regression", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""Python decorators that can be useful in diagnosing and developing your
+projects.
+
+Every decorator is available from the package, its module is only imported
+the first time it is used, so importing the package is cheap and has no
+side effects:
+
+    from decorators import memoize, retry, timer
+
+Modules named after the decorator they define start with an underscore
+(decorators._memoize defines memoize), so that decorators.memoize is always
+the decorator. The examples of each module run with python -m, e.g.
+python -m decorators._memoize
+"""
+
+import importlib
+
+
+# Public name -> module that defines it
+_EXPORTS = {
+    "alphabeticalOutput": "_alphabeticalOutput",
+    "compose": "_compose",
+    "deprecated": "_deprecated",
+    "deprecation_report": "_deprecated",
+    "deprecation_usage": "_deprecated",
+    "diskCache": "diskCacheDecorator",
+    "exponentialBackoff": "_exponentialBackoff",
+    "CallJournal": "_log",
+    "log": "_log",
+    "read_journal": "_log",
+    "memoize": "_memoize",
+    "microBatch": "_microBatch",
+    "REGISTRY": "metrics",
+    "MetricsRegistry": "metrics",
+    "parallelMap": "_parallelMap",
+    "rateLimit": "_rateLimit",
+    "retry": "_retry",
+    "Pool": "_singleton",
+    "PoolTimeout": "_singleton",
+    "pooled": "_singleton",
+    "reset_instances": "_singleton",
+    "singleton": "_singleton",
+    "CallTimeoutError": "_timeout",
+    "timeout": "_timeout",
+    "timer": "timeCount",
+    "timerCount": "timeCount",
+    "set_type_checking": "typeCheck",
+    "type_check": "typeCheck",
+    "BatchValidationError": "_validate",
+    "Constraint": "_validate",
+    "Matches": "_validate",
+    "OneOf": "_validate",
+    "Range": "_validate",
+    "set_validation": "_validate",
+    "validate": "_validate",
+    "Vectorized": "_validate",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
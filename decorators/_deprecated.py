@@ -0,0 +1,211 @@
+# ############# ALL YOU NEED IS THE FOLLOWING FUNCTION ########################
+
+"""Useful information about the decorator:
+- The deprecated decorator marks functions as deprecated
+- Warns users when they call deprecated functions
+- Useful for maintaining backward compatibility while encouraging migration
+- Can provide custom messages with alternatives
+- Works on functions, methods, classes and properties
+- Warns once per call site, later calls from the same place only count
+- Every call site is recorded, deprecation_report() lists them as a
+  migration checklist
+"""
+
+import sys
+import warnings
+from functools import wraps
+
+
+# Calls of deprecated objects: {(name, filename, line number): count}
+_usage = {}
+
+
+def _build_message(kind: str, name: str, message: str,
+                   alternative: str) -> str:
+    warning_msg = f"{kind} '{name}' is deprecated"
+
+    if message:
+        warning_msg += f": {message}"
+
+    if alternative:
+        warning_msg += f". Use '{alternative}' instead"
+
+    return warning_msg + "."
+
+
+def _warn_per_call_site(func: callable, name: str,
+                        warning_msg: str) -> callable:
+    """Wrap func so that it warns the first time each call site calls it"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        caller = sys._getframe(1)
+        site = (name, caller.f_code.co_filename, caller.f_lineno)
+        try:
+            # Fast path: this call site has already been warned
+            _usage[site] += 1
+        except KeyError:
+            # Issue the deprecation warning, the site is only recorded once
+            # it returns: under an "error" filter every call keeps raising
+            warnings.warn(
+                warning_msg,
+                category=DeprecationWarning,
+                stacklevel=2
+            )
+            _usage[site] = 1
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def deprecated(message: str = None, alternative: str = None) -> callable:
+    """
+    Decorator that marks a function as deprecated and issues a warning
+
+    This decorator will display a deprecation warning when the decorated
+    function is called, helping users transition to newer alternatives.
+
+    The message is built once, and each call site is warned only the first
+    time it calls the function, later calls from the same file and line
+    are only counted (see deprecation_report). Classes warn when they are
+    instantiated, properties when they are read, set or deleted.
+
+    Parameters:
+        message (str): custom deprecation message (optional)
+        alternative (str): name of the alternative function to use (optional)
+
+    Returns:
+        callable: decorated function that issues deprecation warnings
+    """
+    def decorator(obj):
+        if isinstance(obj, type):
+            name = obj.__qualname__
+            warning_msg = _build_message("Class", name, message, alternative)
+            if "__init__" in obj.__dict__ or obj.__new__ is object.__new__:
+                obj.__init__ = _warn_per_call_site(obj.__init__, name,
+                                                   warning_msg)
+            else:
+                # Only __new__ is overridden: object.__init__ would reject
+                # the arguments if a wrapper were installed as __init__
+                obj.__new__ = staticmethod(_warn_per_call_site(
+                    obj.__new__, name, warning_msg))
+            return obj
+
+        if isinstance(obj, property):
+            accessor = next(accessor for accessor in (obj.fget, obj.fset,
+                                                      obj.fdel)
+                            if accessor is not None)
+            name = accessor.__qualname__
+            warning_msg = _build_message("Property", name, message,
+                                         alternative)
+            accessors = [None if accessor is None else _warn_per_call_site(
+                accessor, name, warning_msg)
+                for accessor in (obj.fget, obj.fset, obj.fdel)]
+            return property(*accessors, obj.__doc__)
+
+        if isinstance(obj, (classmethod, staticmethod)):
+            return type(obj)(decorator(obj.__func__))
+
+        warning_msg = _build_message("Function", obj.__name__, message,
+                                     alternative)
+        return _warn_per_call_site(obj, obj.__qualname__, warning_msg)
+
+    return decorator
+
+
+def deprecation_usage() -> dict:
+    """
+    Calls of deprecated objects recorded so far
+
+    Returns:
+        dict: {(name, filename, line number): number of calls}
+    """
+    return dict(_usage)
+
+
+def deprecation_report(path: str = None) -> str:
+    """
+    Report of every call site of a deprecated object, most used first
+
+    Parameters:
+        path (str): also write the report to this file (optional)
+
+    Returns:
+        str: one line per call site, "name file:line calls"
+    """
+    lines = [f"{name} {filename}:{line} {count}"
+             for (name, filename, line), count in sorted(
+                 _usage.items(), key=lambda item: (-item[1], item[0]))]
+    report = "\n".join(lines)
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    return report
+
+
+if __name__ == "__main__":
+    ###########################################################################
+    # Here's a generic example of how to use the decorator ####################
+    ###########################################################################
+
+    # First: define a function that you want to mark as deprecated
+    # Second: use @deprecated before the function you want to deprecate
+
+    # General structure of the function that you want to decorate with deprecated
+    @deprecated(message="This function is outdated", alternative="NewFunction")
+    def YourOldFunction(n):  # This function will be marked as deprecated
+        ...  # Your code here
+        return n  # Return the result of the function if needed
+
+    ###########################################################################
+    # Sample function to test the deprecated decorator ########################
+    ###########################################################################
+
+    @deprecated()
+    def old_add(a: int, b: int) -> int:
+        """Old version of add function"""
+        return a + b
+
+    @deprecated(message="This method uses an outdated algorithm",
+                alternative="calculate_total_v2")
+    def calculate_total(items: list) -> int:
+        """Calculates the total (old way)"""
+        return sum(items)
+
+    def calculate_total_v2(items: list) -> int:
+        """New and improved total calculation"""
+        return sum(items)
+
+    @deprecated(alternative="process_data_async")
+    def process_data(data: str) -> str:
+        """Process data synchronously (deprecated)"""
+        return data.upper()
+
+    def process_data_async(data: str) -> str:
+        """Process data asynchronously (new version)"""
+        return data.upper()
+
+    @deprecated(alternative="Invoice")
+    class Bill:
+        """Old name of the invoice class (deprecated)"""
+
+        def __init__(self, amount: float):
+            self.amount = amount
+
+        @deprecated(alternative="amount")
+        @property
+        def total(self) -> float:
+            """Old name of the amount (deprecated)"""
+            return self.amount
+
+    # Test the decorator
+    print(old_add(5, 3))  # Shows deprecation warning
+    print(calculate_total([1, 2, 3, 4]))  # Shows warning with alternative
+    print(process_data("hello"))  # Shows warning with alternative
+
+    for _ in range(1000):
+        old_add(1, 2)  # Warns once for this line, the rest is only counted
+
+    bill = Bill(10.0)  # Shows warning with alternative
+    print(bill.total)  # Shows warning with alternative
+
+    print(deprecation_report())  # Where the deprecated code is still used
@@ -17,7 +17,6 @@
   requests.
 """
 
-import random
 import time
 from functools import wraps
 
@@ -51,37 +50,34 @@ def exponentialBackoff(retries: int = 3,
     return decorator
 
 
-###############################################################################
-# Generic example of how to use the decorator #################################
-###############################################################################
+if __name__ == "__main__":
+    import random
 
+    ###########################################################################
+    # Generic example of how to use the decorator #############################
+    ###########################################################################
 
-@exponentialBackoff(retries=3, exceptions=(ValueError,))
-def yourFunctionWithRetries(arg):  # Name of your function
-    ...  # Replace '...' with the code of your function
-    return arg  # Replace 'arg' with the return value if needed
+    @exponentialBackoff(retries=3, exceptions=(ValueError,))
+    def yourFunctionWithRetries(arg):  # Name of your function
+        ...  # Replace '...' with the code of your function
+        return arg  # Replace 'arg' with the return value if needed
 
+    @exponentialBackoff()  # Default values: retries=3, exceptions=(Exception,)
+    def yourFunctionDefault(arg):  # Name of your function
+        ...  # Replace '...' with the code of your function
+        return arg  # Replace 'arg' with the return value if needed
 
-@exponentialBackoff()  # Default values: retries=3, exceptions=(Exception,)
-def yourFunctionDefault(arg):  # Name of your function
-    ...  # Replace '...' with the code of your function
-    return arg  # Replace 'arg' with the return value if needed
+    ###########################################################################
+    # Simple example of how to use the decorator ##############################
+    ###########################################################################
 
+    @exponentialBackoff(exceptions=(ConnectionError,))
+    def unreliableFunction():
+        if random.choice([True, False]):
+            raise ConnectionError("Connection failed")
+        return "Success"
 
-###############################################################################
-# Simple example of how to use the decorator ##################################
-###############################################################################
+    # Test
+    print(unreliableFunction())
 
-
-@exponentialBackoff(exceptions=(ConnectionError,))
-def unreliableFunction():
-    if random.choice([True, False]):
-        raise ConnectionError("Connection failed")
-    return "Success"
-
-
-# Test
-print(unreliableFunction())
-
-
-###############################################################################
+    ###########################################################################
@@ -0,0 +1,596 @@
+# ############# ALL YOU NEED IS THE FOLLOWING FUNCTION ########################
+
+"""Useful information about the decorator:
+- The log decorator logs the arguments and the result of every call
+- Records go through the standard logging module, so levels, handlers and
+  formatters configured for your application apply
+- Calls only note their caller, thread and time and put them in a bounded
+  queue, a background thread builds the log record from them, renders the
+  values and emits it, so slow repr() or slow handlers never block the
+  call
+- Rendering is truncated with reprlib, large lists or DataFrames are not
+  printed in full
+- Disabled levels and unsampled calls go straight to the function
+- A logged call still costs a few microseconds (two records, the Calling
+  and the returned one), more than printing small arguments directly: use
+  a level or a sample_rate to keep hot functions cheap
+- A CallJournal can also keep a structured record of every call (JSONL or
+  binary, with rotation, or only the last N calls kept in memory and
+  written when an exception occurs) for replay and debugging
+"""
+
+import atexit
+import logging
+import os
+import random
+import reprlib
+import sys
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+
+# Maximum number of records waiting to be rendered
+LOG_QUEUE_SIZE = 10_000
+
+_CALLING = "Calling %s with args: %s and kwargs: %s"
+_RETURNED = "%s returned %s"
+_RAISED = "%s raised %s"
+
+
+class _LogWorker:
+    """Background thread that renders and emits the queued log records"""
+
+    def __init__(self, maxsize: int = LOG_QUEUE_SIZE):
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        # A deque and an Event rather than a queue.Queue: appending takes no
+        # lock, and the worker is only woken when it is waiting, not for
+        # every record
+        self.pending = deque()
+        self._wake = threading.Event()
+        self._drained = threading.Event()
+        # Record of each call site, see _record()
+        self._templates = {}
+        self._thread = None
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="log-decorator", daemon=True)
+                self._thread.start()
+
+    def submit(self, entry: tuple, block: bool) -> None:
+        if self._thread is None:
+            self._start()
+        if len(self.pending) >= self.maxsize:
+            if not block:
+                self.dropped += 1
+                return
+            while len(self.pending) >= self.maxsize:
+                self._drained.clear()
+                self._wake.set()
+                self._drained.wait(0.1)
+        self.pending.append(entry)
+        if not self._wake.is_set():
+            self._wake.set()
+
+    def flush(self) -> None:
+        """Wait until every queued record has been emitted"""
+        if self._thread is not None:
+            done = threading.Event()
+            self.pending.append(done)
+            self._wake.set()
+            done.wait()
+
+    def _run(self) -> None:
+        pending = self.pending
+        while True:
+            while pending:
+                entry = pending.popleft()
+                if not self._drained.is_set():
+                    self._drained.set()
+                if isinstance(entry, threading.Event):
+                    # Appended by flush()
+                    entry.set()
+                    continue
+                try:
+                    # The values are rendered here, when handlers format it
+                    entry[0].handle(_record(*entry, self._templates))
+                except Exception:
+                    pass
+            self._wake.clear()
+            # Records appended before clear() did not set the Event
+            if not pending:
+                self._wake.wait()
+
+
+def _record(logger: logging.Logger, level: int, path: str, line: int,
+            function: str, message: str, values: tuple, created: float,
+            thread: int, threadName: str,
+            templates: dict) -> logging.LogRecord:
+    """Build the record of a call, on the worker thread"""
+    if (type(logger).makeRecord is not logging.Logger.makeRecord
+            or logging.getLogRecordFactory() is not logging.LogRecord):
+        # Customized records: build each one the usual way
+        record = logger.makeRecord(logger.name, level, path, line, message,
+                                   values, None, function)
+        record.relativeCreated -= (record.created - created) * 1000
+    else:
+        # Everything but the values, time and thread is the same for every
+        # record of a call site, copying it is much cheaper than LogRecord()
+        site = (logger.name, level, path, line, function, message)
+        template = templates.get(site)
+        if template is None:
+            template = templates[site] = logger.makeRecord(
+                logger.name, level, path, line, message, None, None,
+                function)
+        record = logging.LogRecord.__new__(logging.LogRecord)
+        record.__dict__.update(template.__dict__)
+        record.args = values
+        record.relativeCreated += (created - record.created) * 1000
+    # Time and thread of the call, not of the worker
+    record.created = created
+    record.msecs = int((created - int(created)) * 1000) + 0.0
+    record.thread = thread
+    record.threadName = threadName
+    return record
+
+
+class _Lazy:
+    """Value rendered with reprlib only when its log record is formatted"""
+
+    __slots__ = ("value", "renderer")
+
+    def __init__(self, value, renderer: reprlib.Repr):
+        self.value = value
+        self.renderer = renderer
+
+    def __str__(self) -> str:
+        return self.renderer.repr(self.value)
+
+    __repr__ = __str__
+
+
+# Types copied by _snapshot()
+_COPIED = frozenset((list, dict, set))
+
+
+def _snapshot(value, renderer: reprlib.Repr):
+    # Values are rendered later on the worker thread: copy what rendering
+    # reads from lists, dicts and sets so later changes do not show up
+    kind = type(value)
+    if kind is list:
+        # reprlib only shows the first maxlist items
+        return value[:renderer.maxlist + 1]
+    if kind is dict or kind is set:
+        return kind(value)
+    return value
+
+
+def _calling(renderer: reprlib.Repr, name: str, args: tuple,
+             kwargs: dict) -> tuple:
+    """Values of the "Calling" message"""
+    # Most calls pass no container and no keyword: nothing to copy then
+    for value in args:
+        if type(value) in _COPIED:
+            args = tuple([_snapshot(a, renderer) for a in args])
+            break
+    if kwargs:
+        kwargs = {k: _snapshot(v, renderer) for k, v in kwargs.items()}
+    return (name, _Lazy(args, renderer), _Lazy(kwargs, renderer))
+
+
+def _submit(logger: logging.Logger, level: int, caller, message: str,
+            values: tuple, block: bool) -> None:
+    """Queue what the record needs from the caller's side"""
+    code = caller.f_code
+    _WORKER.submit((logger, level, code.co_filename, caller.f_lineno,
+                    code.co_name, message, values, time.time(),
+                    threading.get_ident(), threading.current_thread().name),
+                   block)
+
+
+_WORKER = _LogWorker()
+atexit.register(_WORKER.flush)
+if hasattr(os, "register_at_fork"):
+    # The worker thread does not survive a fork, start a new one if needed
+    os.register_at_fork(after_in_child=_WORKER._reset)
+
+
+def flush() -> None:
+    """Block until every pending log record has been emitted"""
+    _WORKER.flush()
+
+
+def dropped() -> int:
+    """Number of records dropped because the queue was full"""
+    return _WORKER.dropped
+
+
+class CallJournal:
+    """
+    Structured record of the calls of the functions decorated with log
+
+    Every call becomes a compact record (timestamp, function, arguments,
+    result, duration, exception) written as JSON lines or as length-prefixed
+    binary records. Records are buffered and written in bulk, and the file
+    is rotated when it grows beyond max_bytes.
+
+    With ring_size only the last ring_size calls are kept in memory, they
+    are written to the file when a call raises an exception.
+
+    Parameters:
+        path (str): file to write the records to
+        format (str): "jsonl" or "binary" (4-byte big-endian length
+                      followed by a pickled record)
+        values (str): how arguments and results are stored, "value" keeps
+                      JSON-friendly values as they are, "repr" stores a
+                      truncated repr and "digest" stores a short hash
+        max_bytes (int): size after which the file is rotated (0 disables)
+        backup_count (int): number of rotated files to keep
+        buffer_size (int): bytes buffered before they are written
+        ring_size (int): keep only the last N calls in memory (optional)
+        max_length (int): maximum length of the repr of each value
+    """
+
+    def __init__(self, path: str, format: str = "jsonl",
+                 values: str = "repr", max_bytes: int = 64 * 1024 * 1024,
+                 backup_count: int = 3, buffer_size: int = 64 * 1024,
+                 ring_size: int = None, max_length: int = 80):
+        if format not in ("jsonl", "binary"):
+            raise ValueError("format must be 'jsonl' or 'binary'")
+        if values not in ("value", "repr", "digest"):
+            raise ValueError("values must be 'value', 'repr' or 'digest'")
+        self.path = path
+        self.format = format
+        self.values = values
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.buffer_size = buffer_size
+        self._renderer = reprlib.Repr()
+        self._renderer.maxstring = self._renderer.maxother = max_length
+        self._ring = deque(maxlen=ring_size) if ring_size else None
+        self._buffer = []
+        self._buffered = 0
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def _render(self, value):
+        if self.values == "value":
+            if value is None or isinstance(value, (bool, int, float, str)):
+                return value
+            if isinstance(value, (list, tuple)):
+                return [self._render(v) for v in value]
+            if isinstance(value, dict):
+                return {str(k): self._render(v) for k, v in value.items()}
+            return self._renderer.repr(value)
+        if self.values == "repr":
+            return self._renderer.repr(value)
+        # Journal-only modules are imported on first use
+        import hashlib
+        import pickle
+        try:
+            data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            data = repr(value).encode("utf-8", "replace")
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+    def _encode(self, record: dict) -> bytes:
+        import json
+        import pickle
+        import struct
+        if self.format == "jsonl":
+            line = json.dumps(record, separators=(",", ":"), default=repr)
+            return line.encode("utf-8") + b"\n"
+        data = pickle.dumps(record, pickle.HIGHEST_PROTOCOL)
+        return struct.pack(">I", len(data)) + data
+
+    def record(self, name: str, timestamp: float, duration: float,
+               args: tuple, kwargs: dict, result, exception) -> None:
+        """Add the record of one call to the journal"""
+        record = {
+            "ts": timestamp,
+            "fn": name,
+            "args": [self._render(a) for a in args],
+            "kwargs": {k: self._render(v) for k, v in kwargs.items()},
+            "result": None if exception else self._render(result),
+            "duration": duration,
+            "exc": None if exception is None else repr(exception),
+        }
+        with self._lock:
+            if self._ring is not None:
+                self._ring.append(record)
+                if exception is None:
+                    return
+                # Dump the calls that led to the exception
+                for item in self._ring:
+                    self._append(self._encode(item))
+                self._ring.clear()
+                self._write()
+                return
+            self._append(self._encode(record))
+            if self._buffered >= self.buffer_size:
+                self._write()
+
+    def _append(self, data: bytes) -> None:
+        self._buffer.append(data)
+        self._buffered += len(data)
+
+    def _write(self) -> None:
+        if not self._buffer:
+            return
+        data = b"".join(self._buffer)
+        self._buffer.clear()
+        self._buffered = 0
+        if self.max_bytes and os.path.exists(self.path) and (
+                os.path.getsize(self.path) + len(data) > self.max_bytes):
+            self._rotate()
+        with open(self.path, "ab") as f:
+            f.write(data)
+
+    def _rotate(self) -> None:
+        if self.backup_count <= 0:
+            os.remove(self.path)
+            return
+        for i in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def flush(self) -> None:
+        """Write the buffered records (the ring buffer is left untouched)"""
+        with self._lock:
+            self._write()
+
+    def dump_ring(self) -> None:
+        """Write the calls currently held in the ring buffer"""
+        with self._lock:
+            if self._ring:
+                for item in self._ring:
+                    self._append(self._encode(item))
+                self._ring.clear()
+            self._write()
+
+
+def read_journal(path: str, format: str = "jsonl"):
+    """
+    Read back the records written by a CallJournal
+
+    Parameters:
+        path (str): journal file
+        format (str): "jsonl" or "binary", as given to the journal
+
+    Returns:
+        generator: one dict per recorded call
+    """
+    import json
+    import pickle
+    import struct
+
+    with open(path, "rb") as f:
+        if format == "jsonl":
+            for line in f:
+                yield json.loads(line)
+            return
+        while True:
+            header = f.read(4)
+            if len(header) < 4:
+                return
+            (size,) = struct.unpack(">I", header)
+            yield pickle.loads(f.read(size))
+
+
+def log(func: callable = None, *, level: int = logging.INFO,
+        logger=None, sample_rate: float = 1.0, max_length: int = 80,
+        policy: str = "drop", journal: CallJournal = None) -> callable:
+    """
+    Decorator that logs the function call details
+
+    Can be used bare (@log) or with options (@log(level=logging.DEBUG)).
+    Records carry the caller's file, line and function and the time and
+    thread of the call, but they are built, and arguments and results
+    rendered, later on a background thread. Lists, dicts and sets are copied (shallowly) at call
+    time, changes made inside other objects before rendering can show up.
+
+    Parameters:
+        func (callable): function to be decorated
+        level (int): logging level of the records (default: INFO)
+        logger (logging.Logger | str): logger or logger name to use
+                                       (default: the function's module)
+        sample_rate (float): fraction of the calls to log (default: 1.0)
+        max_length (int): maximum length of each rendered value
+        policy (str): what to do when the queue is full, "drop" the
+                      record or "block" the caller until there is room
+        journal (CallJournal): also record every call in this journal,
+                               regardless of level and sampling (optional)
+
+    Returns:
+        callable: decorated function
+    """
+    if policy not in ("drop", "block"):
+        raise ValueError("policy must be 'drop' or 'block'")
+
+    renderer = reprlib.Repr()
+    renderer.maxstring = renderer.maxother = max_length
+    block = policy == "block"
+    sampled = sample_rate < 1.0
+
+    def resolve_logger(func: callable) -> logging.Logger:
+        if logger is None:
+            return logging.getLogger(func.__module__)
+        if isinstance(logger, str):
+            return logging.getLogger(logger)
+        return logger
+
+    def decorator(func: callable) -> callable:
+        target = resolve_logger(func)
+        name = func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # Cheap checks first: nothing is queued for skipped calls
+            logged = target.isEnabledFor(level) and (
+                not sampled or random.random() < sample_rate)
+            if not logged and journal is None:
+                return func(*args, **kwargs)
+            if logged:
+                caller = sys._getframe(1)
+                _submit(target, level, caller, _CALLING,
+                        _calling(renderer, name, args, kwargs), block)
+            if journal is not None:
+                timestamp = time.time()
+                start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if journal is not None:
+                    journal.record(name, timestamp,
+                                   time.perf_counter() - start,
+                                   args, kwargs, None, e)
+                if logged:
+                    _submit(target, level, caller, _RAISED,
+                            (name, _Lazy(e, renderer)), block)
+                raise
+            if journal is not None:
+                journal.record(name, timestamp, time.perf_counter() - start,
+                               args, kwargs, result, None)
+            if logged:
+                _submit(target, level, caller, _RETURNED,
+                        (name, _Lazy(_snapshot(result, renderer), renderer)),
+                        block)
+            return result
+        return wrapper
+
+    def fusion(func: callable) -> tuple:
+        # Steps of log, run inline by compose() in a fused wrapper. The
+        # code only contains the sampling and journal steps if they are used
+        logged = "{p}target.isEnabledFor({p}level)"
+        if sampled:
+            logged += " and {p}random() < {p}sample_rate"
+        lines = [
+            "{p}logged = " + logged,
+            "if {p}logged:",
+            "    {p}caller = {p}getframe(1)",
+            "    {p}submit({p}target, {p}level, {p}caller, {p}CALLING, "
+            "{p}calling({p}renderer, {p}name, args, kwargs), {p}block)",
+        ]
+        if journal is not None:
+            lines += ["{p}timestamp = {p}time()",
+                      "{p}start = {p}perf_counter()"]
+        lines += ["try:", "    {inner}", "except Exception as {p}e:"]
+        if journal is not None:
+            lines.append("    {p}journal.record({p}name, {p}timestamp, "
+                         "{p}perf_counter() - {p}start, args, kwargs, None, "
+                         "{p}e)")
+        lines += [
+            "    if {p}logged:",
+            "        {p}submit({p}target, {p}level, {p}caller, {p}RAISED, "
+            "({p}name, {p}Lazy({p}e, {p}renderer)), {p}block)",
+            "    raise",
+        ]
+        if journal is not None:
+            lines.append("{p}journal.record({p}name, {p}timestamp, "
+                         "{p}perf_counter() - {p}start, args, kwargs, "
+                         "result, None)")
+        lines += [
+            "if {p}logged:",
+            "    {p}submit({p}target, {p}level, {p}caller, {p}RETURNED, "
+            "({p}name, {p}Lazy({p}snapshot(result, {p}renderer), "
+            "{p}renderer)), {p}block)",
+        ]
+        return lines, {
+            "target": resolve_logger(func), "level": level,
+            "random": random.random, "sample_rate": sample_rate,
+            "submit": _submit, "block": block, "renderer": renderer,
+            "name": func.__name__, "journal": journal,
+            "time": time.time, "perf_counter": time.perf_counter,
+            "getframe": sys._getframe, "calling": _calling, "Lazy": _Lazy,
+            "snapshot": _snapshot, "CALLING": _CALLING,
+            "RETURNED": _RETURNED, "RAISED": _RAISED,
+        }
+
+    decorator._fusion = fusion
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+# Used bare in compose(log, ...): the steps of log with default options
+log._fusion = lambda func: log()._fusion(func)
+
+
+if __name__ == "__main__":
+    ###########################################################################
+    # Here's a generic example of how to use the decorator ####################
+    ###########################################################################
+
+    # First: define a function that you want to decorate with log
+    # Second: use @log before the function you want to decorate
+
+    # General structure of the function that you want to decorate with log
+    @log
+    def YourFunction(n):  # This function will be decorated with log
+        ...  # Your code here
+        return n  # Return the result of the function if needed
+
+    # Options: debug level, only 10% of the calls, values cut at 40 characters
+    @log(level=logging.DEBUG, sample_rate=0.1, max_length=40)
+    def YourHotFunction(n):  # This function will be decorated with log
+        ...  # Your code here
+        return n  # Return the result of the function if needed
+
+    # Keep a structured record of the calls: every call in calls.jsonl, or
+    # only the last 100 calls, written when one of them raises an exception
+    @log(journal=CallJournal("calls.jsonl"))
+    def YourRecordedFunction(n):  # This function will be decorated with log
+        ...  # Your code here
+        return n  # Return the result of the function if needed
+
+    @log(journal=CallJournal("crashes.jsonl", ring_size=100))
+    def YourDebuggedFunction(n):  # This function will be decorated with log
+        ...  # Your code here
+        return n  # Return the result of the function if needed
+
+    ###########################################################################
+    # Sample function to test the log decorator ###############################
+    ###########################################################################
+
+    @log
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    @log
+    def total(values: list) -> int:
+        return sum(values)
+
+    # The records go through logging, enable the INFO level to see them
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    add(1, 2)
+    add(3, 4)
+    total(list(range(100_000)))  # Only the first items are rendered
+    flush()
+
+    # Binary journal of every call of divide, read back for replay
+    divisions = CallJournal("divisions.bin", format="binary", values="value")
+
+    @log(journal=divisions)
+    def divide(a: float, b: float) -> float:
+        return a / b
+
+    divide(1, 2)
+    divide(3, 4)
+    divisions.flush()
+    for record in read_journal("divisions.bin", format="binary"):
+        print(record["fn"], record["args"], "->", record["result"])
+    os.remove("divisions.bin")
+
+    ###########################################################################
@@ -0,0 +1,149 @@
+# ############# ALL YOU NEED IS THE FOLLOWING FUNCTION ########################
+
+"""Useful information about the decorator:
+- The memoize decorator caches function results in memory
+- It's ideal for pure functions with expensive computations
+- Useful for recursive functions like Fibonacci, factorial, etc.
+- Results are stored in a dictionary for quick retrieval
+- The cache is reachable with func.cache_get(args, kwargs) and
+  func.cache_put(args, kwargs, value)
+"""
+
+from functools import wraps
+
+from .metrics import REGISTRY, function_label
+
+
+MEMOIZE_HITS = REGISTRY.counter(
+    "decorator_memoize_hits", "Calls answered from the memoize cache",
+    ("function",))
+MEMOIZE_MISSES = REGISTRY.counter(
+    "decorator_memoize_misses", "Calls that had to run the function",
+    ("function",))
+
+
+def memoize(func: callable) -> callable:
+    """
+    Decorator that caches function results in memory for faster subsequent calls
+
+    This decorator stores the results of function calls and returns the cached
+    result when the same inputs occur again. Perfect for expensive computations
+    and recursive functions.
+
+    Parameters:
+        func (callable): function to be decorated
+
+    Returns:
+        callable: decorated function with caching
+    """
+    cache = {}
+    hits = MEMOIZE_HITS.labels(function_label(func))
+    misses = MEMOIZE_MISSES.labels(function_label(func))
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        # Create a unique key from arguments
+        # Convert kwargs to sorted tuple for hashability
+        key = (args, tuple(sorted(kwargs.items())))
+
+        # Return cached result if available
+        if key in cache:
+            hits.inc()
+            print(f"Returning cached result for {func.__name__}{args}")
+            return cache[key]
+
+        # Compute and cache the result
+        misses.inc()
+        result = func(*args, **kwargs)
+        cache[key] = result
+        return result
+
+    # Lets other decorators (parallelMap) read and fill the cache
+    wrapper.cache_get, wrapper.cache_put = _cache_hooks(cache)
+    return wrapper
+
+
+def _cache_hooks(cache: dict) -> tuple:
+    """cache_get and cache_put functions reaching cache"""
+    def cache_get(args: tuple, kwargs: dict = None) -> tuple:
+        """Return (found, value) for the call func(*args, **kwargs)"""
+        key = (args, tuple(sorted((kwargs or {}).items())))
+        if key in cache:
+            return True, cache[key]
+        return False, None
+
+    def cache_put(args: tuple, kwargs: dict, value) -> None:
+        """Store value as the result of func(*args, **kwargs)"""
+        cache[(args, tuple(sorted((kwargs or {}).items())))] = value
+
+    return cache_get, cache_put
+
+
+def _fusion(func: callable) -> tuple:
+    """Steps of memoize, run inline by compose() in a fused wrapper"""
+    hits = MEMOIZE_HITS.labels(function_label(func))
+
+    def hit(args: tuple) -> None:
+        hits.inc()
+        print(f"Returning cached result for {func.__name__}{args}")
+
+    lines = [
+        "{p}key = (args, tuple(sorted(kwargs.items())))",
+        "if {p}key in {p}cache:",
+        "    {p}hit(args)",
+        "    result = {p}cache[{p}key]",
+        "else:",
+        "    {p}misses.inc()",
+        "    {inner}",
+        "    {p}cache[{p}key] = result",
+    ]
+    cache = {}
+    cache_get, cache_put = _cache_hooks(cache)
+    names = {"cache": cache, "hit": hit,
+             "misses": MEMOIZE_MISSES.labels(function_label(func))}
+    # The fused wrapper exposes the same hooks as memoize's own wrapper
+    return lines, names, {"cache_get": cache_get, "cache_put": cache_put}
+
+
+memoize._fusion = _fusion
+
+
+if __name__ == "__main__":
+    ###########################################################################
+    # Here's a generic example of how to use the decorator ####################
+    ###########################################################################
+
+    # First: define a function that you want to decorate with memoize
+    # Second: use @memoize before the function you want to decorate
+
+    # General structure of the function that you want to decorate with memoize
+    @memoize
+    def YourFunction(n):  # This function will be decorated with memoize
+        ...  # Your code here
+        return n  # Return the result of the function if needed
+
+    ###########################################################################
+    # Sample function to test the memoize decorator ###########################
+    ###########################################################################
+
+    @memoize
+    def fibonacci(n: int) -> int:
+        """Calculate nth Fibonacci number"""
+        if n < 2:
+            return n
+        return fibonacci(n - 1) + fibonacci(n - 2)
+
+    @memoize
+    def expensive_calculation(x: int, y: int) -> int:
+        """Simulate an expensive calculation"""
+        print(f"Computing {x} * {y}...")
+        result = x * y
+        return result
+
+    # Test the decorator
+    print(f"Fibonacci(10): {fibonacci(10)}")
+    print(f"Fibonacci(15): {fibonacci(15)}")
+
+    print(expensive_calculation(5, 10))  # Computes
+    print(expensive_calculation(5, 10))  # Returns from cache
+    print(expensive_calculation(3, 7))   # Computes new value
@@ -0,0 +1,248 @@
+# ALL YOU NEED IS THE FOLLOWING CODE AND THE IMPORT STATEMENTS ################
+
+"""Useful information about the decorator:
+- microBatch turns a function that handles a list of items (a bulk
+  endpoint) into a function that handles one item
+- Concurrent calls from threads or coroutines are collected for up to
+  max_wait seconds, or until max_size items are waiting, and the batch
+  function is called once for all of them
+- Each caller gets its own result, or its own exception
+- Items must be hashable, the same item requested twice in a batch is
+  only sent once
+- Put retry or rateLimit below microBatch: they then apply to the bulk
+  call, so a whole batch spends a single retry loop or rate limit token
+"""
+
+import asyncio
+import collections.abc
+import inspect
+import threading
+import weakref
+from functools import wraps
+
+from .metrics import REGISTRY, function_label
+
+
+MICRO_BATCH_CALLS = REGISTRY.counter(
+    "decorator_micro_batch_calls", "Single calls received by microBatch",
+    ("function",))
+MICRO_BATCH_SIZE = REGISTRY.histogram(
+    "decorator_micro_batch_size", "Items sent in one bulk call",
+    ("function",), buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500, 1000))
+
+
+class _Batch:
+    """Items waiting to be sent together, then their results"""
+
+    __slots__ = ("items", "results", "error", "full", "done", "timer")
+
+    def __init__(self, done, full=None):
+        # dict used as an ordered set of the requested items
+        self.items = {}
+        self.results = None
+        self.error = None
+        # Threads: events set when the batch is full and when it has run
+        # asyncio: a future resolved when it has run, and the max_wait timer
+        self.done = done
+        self.full = full
+        self.timer = None
+
+
+def _resultsByItem(items: list, results) -> dict:
+    """Match what the batch function returned with the items it was given"""
+    if isinstance(results, collections.abc.Mapping):
+        return results
+    results = list(results)
+    if len(results) != len(items):
+        raise ValueError(f"The batch function returned {len(results)} "
+                         f"results for {len(items)} items")
+    return dict(zip(items, results))
+
+
+def _result(batch: _Batch, item):
+    if batch.error is not None:
+        raise batch.error
+    try:
+        result = batch.results[item]
+    except KeyError:
+        raise KeyError(f"The batch function returned no result for "
+                       f"{item!r}") from None
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def microBatch(max_size: int = 100, max_wait: float = 0.005) -> callable:
+    """
+    Decorator that merges concurrent single-item calls into one bulk call
+
+    The decorated function receives a list of items and returns their
+    results, either as a sequence in the same order or as a mapping from
+    item to result. A result that is an exception is raised to the caller
+    of that item only, an exception raised by the batch function is raised
+    to every caller of the batch.
+
+    The decorated function is then called with one item. If the batch
+    function is a coroutine function the calls must be awaited and are
+    batched per event loop, otherwise calls from several threads are
+    batched together.
+
+    Parameters:
+        max_size (int): maximum number of items sent in one batch, the
+                        call that fills a batch sends it right away
+        max_wait (float): maximum time in seconds the first call of a batch
+                          waits for other calls to join it
+
+    Returns:
+        callable: decorator
+    """
+    if max_size < 1:
+        raise ValueError("max_size must be at least 1")
+
+    def decorator(func: callable) -> callable:
+        calls = MICRO_BATCH_CALLS.labels(function_label(func))
+        sizes = MICRO_BATCH_SIZE.labels(function_label(func))
+
+        if inspect.iscoroutinefunction(func):
+            return _asyncBatcher(func, max_size, max_wait, calls, sizes)
+
+        lock = threading.Lock()
+        current = None
+
+        def run(batch: _Batch) -> None:
+            items = list(batch.items)
+            sizes.observe(len(items))
+            try:
+                batch.results = _resultsByItem(items, func(items))
+            except BaseException as e:
+                # Raised to every caller of the batch
+                batch.error = e
+            batch.done.set()
+
+        @wraps(func)
+        def wrapper(item):
+            nonlocal current
+            # Unhashable items must fail before joining a batch, or the
+            # batch would be left without a caller to send it
+            hash(item)
+            calls.inc()
+            with lock:
+                batch = current
+                leader = batch is None
+                if leader:
+                    batch = current = _Batch(threading.Event(),
+                                             threading.Event())
+                batch.items[item] = None
+                full = len(batch.items) >= max_size
+                if full:
+                    current = None
+            if full:
+                # The call that fills the batch sends it
+                batch.full.set()
+                run(batch)
+            elif leader:
+                # The first call waits for others to join, then sends the
+                # batch unless it was filled and sent in the meantime
+                if not batch.full.wait(max_wait):
+                    with lock:
+                        mine = current is batch
+                        if mine:
+                            current = None
+                    if mine:
+                        run(batch)
+            batch.done.wait()
+            return _result(batch, item)
+        return wrapper
+    return decorator
+
+
+def _asyncBatcher(func: callable, max_size: int, max_wait: float, calls,
+                  sizes) -> callable:
+    # Event loop -> batch being filled, asyncio needs no lock
+    current = weakref.WeakKeyDictionary()
+    # The event loop only keeps weak references to tasks
+    tasks = set()
+
+    async def run(batch: _Batch) -> None:
+        items = list(batch.items)
+        sizes.observe(len(items))
+        try:
+            batch.results = _resultsByItem(items, await func(items))
+        except BaseException as e:
+            # Raised to every caller of the batch
+            batch.error = e
+        batch.done.set_result(batch)
+
+    def send(loop, batch: _Batch) -> None:
+        if current.get(loop) is batch:
+            del current[loop]
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = loop.create_task(run(batch))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    @wraps(func)
+    async def wrapper(item):
+        # Fails before a batch is created for nothing, see the thread version
+        hash(item)
+        calls.inc()
+        loop = asyncio.get_running_loop()
+        batch = current.get(loop)
+        if batch is None:
+            batch = current[loop] = _Batch(loop.create_future())
+            batch.timer = loop.call_later(max_wait, send, loop, batch)
+        batch.items[item] = None
+        if len(batch.items) >= max_size:
+            send(loop, batch)
+        # A cancelled caller must not cancel the batch of the others
+        return _result(await asyncio.shield(batch.done), item)
+    return wrapper
+
+
+if __name__ == "__main__":
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    ###########################################################################
+    # Here's a generic example of how to use the decorator ####################
+    ###########################################################################
+
+    @microBatch(max_size=100, max_wait=0.005)
+    def YourFunction(items):  # Receives a list of items
+        ...  # Your bulk call here
+        return items  # One result per item, or a dict item -> result
+
+    # YourFunction(item) now returns the result of a single item
+
+    ###########################################################################
+    # Sample functions to test the microBatch decorator #######################
+    ###########################################################################
+
+    bulkCalls = []
+
+    @microBatch(max_size=50, max_wait=0.01)
+    def fetchSquares(numbers: list) -> dict:
+        bulkCalls.append(len(numbers))
+        time.sleep(0.01)  # Simulate one round trip to a bulk endpoint
+        return {n: ValueError("negative") if n < 0 else n * n
+                for n in numbers}
+
+    with ThreadPoolExecutor(100) as pool:
+        print(sum(pool.map(fetchSquares, range(1000))))  # 332833500
+    print(f"1000 calls, {len(bulkCalls)} bulk calls")
+
+    try:
+        fetchSquares(-1)
+    except ValueError as e:
+        print(e)  # negative
+
+    @microBatch(max_size=10)
+    async def fetchNames(ids: list) -> list:
+        await asyncio.sleep(0.01)
+        return [f"user{i}" for i in ids]
+
+    async def main():
+        return await asyncio.gather(*(fetchNames(i) for i in range(25)))
+
+    print(asyncio.run(main())[:3])  # ['user0', 'user1', 'user2']
@@ -0,0 +1,214 @@
+# ALL YOU NEED IS THE FOLLOWING CODE AND THE IMPORT STATEMENTS ################
+
+"""Useful information about the decorator:
+- parallelMap gives a function a .map() method that runs it over many
+  inputs on a pool of processes or threads
+- When the function is cached (memoize, diskCache) the cache is checked
+  first, only the misses are sent to the pool and their results are
+  written back into the cache
+- Results stream back in the order of the inputs, or as soon as they are
+  ready with ordered=False (faster when some calls are slower than others)
+- The process pool uses every core but needs a function defined at module
+  level, the thread pool works with any function but only helps when the
+  function releases the GIL (I/O, NumPy, ...)
+"""
+
+import collections
+import concurrent.futures
+import os
+
+from .metrics import REGISTRY, function_label
+
+
+PARALLEL_MAP_ITEMS = REGISTRY.counter(
+    "decorator_parallel_map_items", "Inputs handled by parallelMap",
+    ("function", "source"))
+
+_EXECUTORS = ("process", "thread")
+
+
+def _target(func: callable) -> callable:
+    """Function run by the workers: a cached function without its cache"""
+    if hasattr(func, "cache_put"):
+        # Fused by compose: every other fused step still runs
+        return getattr(func, "__uncached__", func.__wrapped__)
+    return func
+
+
+def _runChunk(func: callable, chunk: list) -> list:
+    # Runs in the workers, process pools receive func pickled by reference
+    # (module and name) and find it again in their copy of the module
+    target = _target(func)
+    return [target(*args) for args in chunk]
+
+
+def _blocks(inputs, cacheGet: callable, chunksize: int):
+    """
+    Group the inputs into blocks holding at most chunksize misses
+
+    Yields (items, values, missing): the arguments of every input, their
+    cached values and the indices of the inputs that were not cached.
+    """
+    items, values, missing = [], [], []
+    for args in inputs:
+        found, value = (False, None) if cacheGet is None \
+            else cacheGet(args, None)
+        if not found:
+            missing.append(len(items))
+        items.append(args)
+        values.append(value)
+        if len(missing) == chunksize or (not missing
+                                         and len(items) == chunksize):
+            yield items, values, missing
+            items, values, missing = [], [], []
+    if items:
+        yield items, values, missing
+
+
+def _results(func: callable, inputs, executor: str, workers: int,
+             chunksize: int, ordered: bool):
+    cacheGet = getattr(func, "cache_get", None)
+    cachePut = getattr(func, "cache_put", None)
+    fromCache = PARALLEL_MAP_ITEMS.labels(function_label(func), "cache")
+    fromPool = PARALLEL_MAP_ITEMS.labels(function_label(func), "pool")
+    # (block, future) in input order, future is None for cached blocks
+    pending = collections.deque()
+
+    def finish(block: tuple, future) -> list:
+        items, values, missing = block
+        if future is not None:
+            for index, value in zip(missing, future.result()):
+                values[index] = value
+                if cachePut is not None:
+                    cachePut(items[index], None, value)
+            fromPool.inc(len(missing))
+        fromCache.inc(len(items) - len(missing))
+        return values
+
+    def ready():
+        # Ordered: only the oldest blocks, unordered: any finished block
+        if ordered:
+            while pending and (pending[0][1] is None or pending[0][1].done()):
+                yield from finish(*pending.popleft())
+            return
+        for entry in [entry for entry in pending
+                      if entry[1] is None or entry[1].done()]:
+            pending.remove(entry)
+            yield from finish(*entry)
+
+    def wait() -> None:
+        entries = [pending[0]] if ordered else pending
+        futures = [future for _, future in entries if future is not None]
+        if futures:
+            concurrent.futures.wait(
+                futures, return_when=concurrent.futures.FIRST_COMPLETED)
+
+    if executor == "process":
+        pool = concurrent.futures.ProcessPoolExecutor(workers)
+    else:
+        pool = concurrent.futures.ThreadPoolExecutor(workers)
+    window = 2 * (workers or os.cpu_count() or 1)
+    try:
+        for block in _blocks(inputs, cacheGet, chunksize):
+            items, _, missing = block
+            future = None
+            if missing:
+                future = pool.submit(_runChunk, func,
+                                     [items[index] for index in missing])
+            pending.append((block, future))
+            # Bound the work in flight so long inputs are streamed
+            if len(pending) >= window:
+                wait()
+            yield from ready()
+        while pending:
+            wait()
+            yield from ready()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def parallelMap(func: callable = None, *, workers: int = None,
+                chunksize: int = 64, executor: str = "process",
+                ordered: bool = True) -> callable:
+    """
+    Decorator that adds a parallel .map() method to the decorated function
+
+    func.map(*iterables) returns an iterator over func(*args) for the items
+    of the iterables taken together, like the builtin map. Calls are
+    unchanged. Place it above memoize or diskCache:
+
+        @parallelMap
+        @memoize
+        def func(...):
+
+    so .map() skips the inputs that are already cached and stores the new
+    results. Every option can also be given to .map() itself.
+
+    Parameters:
+        func (callable): function to be decorated
+        workers (int): size of the pool, defaults to the number of CPUs
+        chunksize (int): number of calls sent to a worker at once
+        executor (str): "process" or "thread"
+        ordered (bool): yield the results in the order of the inputs,
+                        False yields them as soon as they are ready
+
+    Returns:
+        callable: the function, with a map method
+    """
+    def decorator(func: callable) -> callable:
+        def parallel(*iterables, workers: int = workers,
+                     chunksize: int = chunksize, executor: str = executor,
+                     ordered: bool = ordered):
+            if executor not in _EXECUTORS:
+                raise ValueError(f"executor must be one of {_EXECUTORS}")
+            if chunksize < 1:
+                raise ValueError("chunksize must be at least 1")
+            return _results(func, zip(*iterables), executor, workers,
+                            chunksize, ordered)
+
+        func.map = parallel
+        return func
+
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+
+if __name__ == "__main__":
+    import time
+
+    from . import memoize
+
+    ###########################################################################
+    # Here's a generic example of how to use the decorator ####################
+    ###########################################################################
+
+    @parallelMap(workers=4)
+    @memoize  # Optional: cached inputs are not sent to the pool
+    def YourFunction(n):  # Must be defined at module level for processes
+        ...  # Your code here
+        return n  # Return the result of the function if needed
+
+    # for result in YourFunction.map(range(100_000)):
+
+    ###########################################################################
+    # Sample function to test the parallelMap decorator #######################
+    ###########################################################################
+
+    @parallelMap(chunksize=16)
+    @memoize
+    def slowSquare(n: int) -> int:
+        time.sleep(0.01)  # Simulate a slow computation
+        return n * n
+
+    start = time.perf_counter()
+    print(sum(slowSquare.map(range(200), workers=8)))  # Computed in the pool
+    print(f"first map: {time.perf_counter() - start:.2f} seconds")
+
+    start = time.perf_counter()
+    print(sum(slowSquare.map(range(200))))  # Answered from the cache
+    print(f"second map: {time.perf_counter() - start:.2f} seconds")
+
+    # Threads, results in the order they finish
+    print(sorted(slowSquare.map(range(195, 205), executor="thread",
+                                ordered=False)))
@@ -7,6 +7,16 @@
 import time
 from functools import wraps
 
+from .metrics import REGISTRY, function_label
+
+
+RATE_LIMIT_THROTTLED = REGISTRY.counter(
+    "decorator_rate_limit_throttled", "Calls delayed by rateLimit",
+    ("function",))
+RATE_LIMIT_WAIT_SECONDS = REGISTRY.histogram(
+    "decorator_rate_limit_wait_seconds", "Time spent waiting for rateLimit",
+    ("function",))
+
 
 def rateLimit(maxCalls: int, period: float) -> callable:
     """
@@ -27,6 +37,8 @@ def rateLimit(maxCalls: int, period: float) -> callable:
     def decorator(func: callable) -> callable:
         # List to store the timestamps of the calls
         calls = list()
+        throttled = RATE_LIMIT_THROTTLED.labels(function_label(func))
+        waited = RATE_LIMIT_WAIT_SECONDS.labels(function_label(func))
 
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -39,6 +51,8 @@ def rateLimit(maxCalls: int, period: float) -> callable:
             # If the number of calls is greater than the maximum
             if len(calls) >= maxCalls:
                 wait = period - (now - calls[0])
+                throttled.inc()
+                waited.observe(wait)
                 print(f"Rate limit exceeded. Waiting {wait:.2f} seconds")
                 time.sleep(wait)
             # Add the current call to the list
@@ -48,29 +62,26 @@ def rateLimit(maxCalls: int, period: float) -> callable:
     return decorator
 
 
-###############################################################################
-# Generic example of how to use the decorator #################################
-###############################################################################
-
-
-@rateLimit(maxCalls=2, period=5)  # 2 calls every 5 seconds
-def yourFunction(arg):  # Your function here
-    ...  # Your code here
-    return arg  # Your return here if needed
-
-
-###############################################################################
-# Simple example of how to use the decorator ##################################
-###############################################################################
+if __name__ == "__main__":
+    ###########################################################################
+    # Generic example of how to use the decorator #############################
+    ###########################################################################
 
+    @rateLimit(maxCalls=2, period=5)  # 2 calls every 5 seconds
+    def yourFunction(arg):  # Your function here
+        ...  # Your code here
+        return arg  # Your return here if needed
 
-@rateLimit(maxCalls=1, period=2)
-def test_rate_limit():
-    print("Function called")
-    time.sleep(0.5)
+    ###########################################################################
+    # Simple example of how to use the decorator ##############################
+    ###########################################################################
 
+    @rateLimit(maxCalls=1, period=2)
+    def test_rate_limit():
+        print("Function called")
+        time.sleep(0.5)
 
-for _ in range(10):
-    test_rate_limit()
+    for _ in range(10):
+        test_rate_limit()
 
-###############################################################################
+    ###########################################################################
@@ -0,0 +1,151 @@
+# ############# ALL YOU NEED IS THE FOLLOWING FUNCTION ########################
+
+"""Useful information about the decorator:
+- The retry decorator automatically retries a function on failure
+- Useful for network requests, API calls, and unreliable operations
+- Can specify the number of retries and delay between attempts
+- Can catch specific exceptions or all exceptions
+"""
+
+import time
+from functools import wraps
+
+from .metrics import REGISTRY, function_label
+
+
+RETRY_ATTEMPTS = REGISTRY.counter(
+    "decorator_retry_attempts", "Attempts made by retry-decorated functions",
+    ("function",))
+RETRY_FAILURES = REGISTRY.counter(
+    "decorator_retry_failures", "Calls that failed after every attempt",
+    ("function",))
+
+
+def retry(attempts: int = 3, delay: float = 1.0,
+          exceptions: tuple = (Exception,)) -> callable:
+    """
+    Decorator that retries a function a specified number of times on failure
+
+    This decorator will catch specified exceptions and retry the function
+    after a delay. Useful for operations that may fail temporarily.
+
+    Parameters:
+        attempts (int): maximum number of attempts (default: 3)
+        delay (float): delay in seconds between attempts (default: 1.0)
+        exceptions (tuple): tuple of exceptions to catch (default: (Exception,))
+
+    Returns:
+        callable: decorated function with retry logic
+    """
+    def decorator(func: callable) -> callable:
+        attempts_made = RETRY_ATTEMPTS.labels(function_label(func))
+        failures = RETRY_FAILURES.labels(function_label(func))
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            last_exception = None
+
+            for attempt in range(1, attempts + 1):
+                attempts_made.inc()
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    last_exception = e
+                    if attempt < attempts:
+                        print(f"Attempt {attempt}/{attempts} failed: {e}")
+                        print(f"Retrying in {delay} seconds...")
+                        time.sleep(delay)
+                    else:
+                        failures.inc()
+                        print(f"All {attempts} attempts failed.")
+
+            # If all attempts failed, raise the last exception
+            raise last_exception
+
+        return wrapper
+
+    def fusion(func: callable) -> tuple:
+        # Steps of retry, run inline by compose() in a fused wrapper
+        if attempts < 1:
+            return None
+        failures = RETRY_FAILURES.labels(function_label(func))
+
+        def failed(attempt: int, e: Exception) -> None:
+            if attempt < attempts:
+                print(f"Attempt {attempt}/{attempts} failed: {e}")
+                print(f"Retrying in {delay} seconds...")
+                time.sleep(delay)
+            else:
+                failures.inc()
+                print(f"All {attempts} attempts failed.")
+
+        lines = [
+            "for {p}attempt in {p}attempts:",
+            "    {p}attempts_made.inc()",
+            "    try:",
+            "        {inner}",
+            "        break",
+            "    except {p}exceptions as {p}e:",
+            "        {p}failed({p}attempt, {p}e)",
+            "        if {p}attempt == {p}last:",
+            "            raise",
+        ]
+        return lines, {
+            "attempts": range(1, attempts + 1),
+            "last": attempts,
+            "attempts_made": RETRY_ATTEMPTS.labels(function_label(func)),
+            "exceptions": exceptions,
+            "failed": failed,
+        }
+
+    decorator._fusion = fusion
+    return decorator
+
+
+if __name__ == "__main__":
+    import random
+
+    ###########################################################################
+    # Here's a generic example of how to use the decorator ####################
+    ###########################################################################
+
+    # First: define a function that you want to decorate with retry
+    # Second: use @retry before the function you want to decorate
+
+    # General structure of the function that you want to decorate with retry
+    @retry(attempts=3, delay=1.0)
+    def YourFunction(n):  # This function will be decorated with retry
+        ...  # Your code here
+        return n  # Return the result of the function if needed
+
+    ###########################################################################
+    # Sample function to test the retry decorator #############################
+    ###########################################################################
+
+    @retry(attempts=5, delay=0.5, exceptions=(ValueError, ConnectionError))
+    def unreliable_api_call(success_rate: float = 0.3):
+        """Simulates an unreliable API call"""
+        if random.random() > success_rate:
+            raise ConnectionError("API connection failed")
+        return "Success! Data retrieved."
+
+    @retry(attempts=3, delay=1)
+    def fetch_data(url: str):
+        """Simulates fetching data from a URL"""
+        print(f"Fetching data from {url}...")
+        if random.random() > 0.7:
+            return f"Data from {url}"
+        raise ConnectionError("Network error")
+
+    # Test the decorator
+    try:
+        result = unreliable_api_call(0.5)
+        print(result)
+    except Exception as e:
+        print(f"Failed: {e}")
+
+    try:
+        data = fetch_data("https://api.example.com/data")
+        print(data)
+    except Exception as e:
+        print(f"Failed to fetch data: {e}")
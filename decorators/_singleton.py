@@ -0,0 +1,718 @@
+# ############# ALL YOU NEED IS THE FOLLOWING FUNCTION ########################
+
+"""Useful information about the decorator:
+- The singleton decorator ensures a class has only one instance
+- Useful for configuration managers, database connections, loggers
+- Automatically returns the same instance on subsequent instantiations
+- Thread-safe implementation for multi-threaded applications
+- The decorated class is left in place: isinstance, subclassing and
+  pickling work
+- Instances are forgotten in a child process after fork(), so workers of
+  a process pool do not share sockets or locks with their parent
+- Multiton mode keeps one instance per key derived from the arguments
+- The pooled decorator is the alternative when one shared instance is a
+  bottleneck: a bounded pool of instances that threads check out and back
+  in, with a maximum wait, health checks, idle eviction and metrics
+"""
+
+import inspect
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+
+from .metrics import REGISTRY, function_label
+
+
+# Instances of every singleton class, keyed by class (or (class, key))
+_instances = {}
+# id() of the instances above, their __init__ already ran
+_initialized = set()
+_lock = threading.RLock()
+
+
+def _forget(key) -> None:
+    _initialized.discard(id(_instances.pop(key)))
+
+
+def _reset_after_fork() -> None:
+    global _lock
+    # The lock may have been held by another thread at fork time
+    _lock = threading.RLock()
+    for key in list(_instances):
+        cls = key[0] if isinstance(key, tuple) else key
+        if cls._singleton_reset_on_fork:
+            _forget(key)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _wrap_init(init: callable) -> callable:
+    """
+    __init__ of singleton classes: __new__ already initialized the
+    instance, calling the class again must not initialize it twice
+    """
+    if init is object.__init__:
+        # object.__init__ rejects the arguments once __new__ is overridden
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+    else:
+        @wraps(init)
+        def __init__(self, *args, **kwargs) -> None:
+            if id(self) not in _initialized:
+                init(self, *args, **kwargs)
+
+    __init__._singleton_init = True
+    return __init__
+
+
+def _singleton_new(cls, *args, **kwargs):
+    """__new__ of singleton classes: hands out the shared instances"""
+    key_func = cls._singleton_key
+    key = cls if key_func is None else (cls, key_func(*args, **kwargs))
+    # Fast path: no lock once the instance exists
+    instance = _instances.get(key)
+    if instance is None:
+        with _lock:
+            instance = _instances.get(key)
+            if instance is None:
+                new = cls._singleton_original_new
+                if new is object.__new__:
+                    instance = new(cls)
+                else:
+                    instance = new(cls, *args, **kwargs)
+                # Runs the whole chain, super().__init__ included
+                cls.__init__(instance, *args, **kwargs)
+                _initialized.add(id(instance))
+                _instances[key] = instance
+    return instance
+
+
+def _restore(cls, key, state):
+    """Unpickle a singleton instance: the live instance when there is one"""
+    with _lock:
+        instance = None if key is None else _instances.get(key)
+        if instance is not None:
+            return instance
+        # Like copyreg: a bare instance, filled from the pickled state
+        instance = cls._singleton_original_new(cls)
+        setstate = getattr(instance, "__setstate__", None)
+        if setstate is not None:
+            setstate(state)
+        elif state:
+            slots = None
+            if isinstance(state, tuple):
+                state, slots = state
+            if state:
+                instance.__dict__.update(state)
+            for name, value in (slots or {}).items():
+                setattr(instance, name, value)
+        if key is not None:
+            _initialized.add(id(instance))
+            _instances[key] = instance
+        return instance
+
+
+def _singleton_reduce(self):
+    # Pickling by value would create a second instance when unpickled
+    with _lock:
+        key = next((key for key, instance in _instances.items()
+                    if instance is self), None)
+    getstate = getattr(self, "__getstate__", None)
+    state = getstate() if getstate is not None else getattr(
+        self, "__dict__", None)
+    return _restore, (type(self), key, state)
+
+
+def _arguments_key(*args, **kwargs):
+    # Same key as memoize: positional arguments and sorted keywords
+    return (args, tuple(sorted(kwargs.items())))
+
+
+def _bound_key(cls) -> callable:
+    """
+    Key of the constructor arguments, bound to the signature of the class
+    so that C("a"), C("a", 1) and C("a", port=1) give the same instance
+    """
+    init = cls._singleton_original_init
+    if init is not object.__init__:
+        constructor = init
+    elif cls._singleton_original_new is not object.__new__:
+        constructor = cls._singleton_original_new
+    else:
+        return _arguments_key
+    try:
+        sig = inspect.signature(constructor)
+    except (TypeError, ValueError):
+        return _arguments_key
+    # Without self (or cls for __new__)
+    sig = sig.replace(parameters=list(sig.parameters.values())[1:])
+
+    def key(*args, **kwargs):
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return (bound.args, tuple(sorted(bound.kwargs.items())))
+    return key
+
+
+def singleton(cls=None, *, key=None, warmup=None,
+              reset_on_fork: bool = True):
+    """
+    Decorator that converts a class into a singleton
+
+    This decorator ensures that only one instance of the decorated class
+    can exist. All attempts to create new instances will return the same
+    object. Thread-safe implementation.
+
+    The class itself is returned, with __new__ handing out the shared
+    instance, so isinstance checks and subclassing keep working (every
+    subclass gets its own instance) and pickled instances come back as the
+    live instance. After a fork() the child process creates its own
+    instances instead of sharing the parent's.
+
+    Parameters:
+        cls (class): class to be converted to singleton
+        key (bool | callable): multiton mode, True keeps one instance per
+                               distinct constructor arguments (bound to
+                               the signature, so defaults and keywords
+                               give the same key), a callable receives the
+                               arguments and returns the key
+        warmup (bool | iterable): create the instances when the class is
+                                  decorated, True for a singleton, or the
+                                  arguments of each instance for a multiton
+                                  (a tuple of positional arguments, a dict
+                                  of keyword arguments or a single value)
+        reset_on_fork (bool): forget the instances in a forked child
+                              (default: True)
+
+    Returns:
+        class: the class, made a singleton
+
+    Example:
+        @singleton
+        class Database:
+            def __init__(self):
+                self.connection = "Connected"
+
+        @singleton(key=True)
+        class Connection:
+            def __init__(self, host):
+                self.host = host
+    """
+    def hook(klass) -> None:
+        # Take over __new__ and __init__ of the class, or of a subclass
+        # that defines its own
+        if klass.__new__ is not _singleton_new:
+            klass._singleton_original_new = klass.__new__
+            klass.__new__ = _singleton_new
+        if not getattr(klass.__init__, "_singleton_init", False):
+            klass._singleton_original_init = klass.__init__
+            klass.__init__ = _wrap_init(klass.__init__)
+        if key is True:
+            klass._singleton_key = staticmethod(_bound_key(klass))
+
+    def decorator(cls):
+        cls._singleton_key = None if key is None or key is True \
+            else staticmethod(key)
+        cls._singleton_reset_on_fork = reset_on_fork
+        hook(cls)
+        if "__reduce__" not in cls.__dict__ \
+                and "__reduce_ex__" not in cls.__dict__:
+            cls.__reduce__ = _singleton_reduce
+
+        # Subclasses are singletons too, with their own instance
+        init_subclass = cls.__dict__.get("__init_subclass__")
+
+        def __init_subclass__(subclass, **kwargs):
+            if init_subclass is not None:
+                init_subclass.__get__(None, subclass)(**kwargs)
+            else:
+                super(cls, subclass).__init_subclass__(**kwargs)
+            hook(subclass)
+
+        cls.__init_subclass__ = classmethod(__init_subclass__)
+
+        if warmup is True:
+            cls()
+        elif warmup:
+            for arguments in warmup:
+                if isinstance(arguments, tuple):
+                    cls(*arguments)
+                elif isinstance(arguments, dict):
+                    cls(**arguments)
+                else:
+                    cls(arguments)
+        return cls
+
+    if cls is not None:
+        return decorator(cls)
+    return decorator
+
+
+def reset_instances(cls=None) -> None:
+    """
+    Forget the instances of a singleton class, or of every singleton class
+
+    The next instantiation creates a new instance.
+
+    Parameters:
+        cls (class): singleton class to reset (default: all of them)
+    """
+    with _lock:
+        for key in list(_instances):
+            owner = key[0] if isinstance(key, tuple) else key
+            if cls is None or issubclass(owner, cls):
+                _forget(key)
+
+
+POOL_IN_USE = REGISTRY.gauge(
+    "decorator_pool_in_use", "Pooled instances currently checked out",
+    ("pool",))
+POOL_IDLE = REGISTRY.gauge(
+    "decorator_pool_idle", "Pooled instances waiting to be checked out",
+    ("pool",))
+POOL_WAITING = REGISTRY.gauge(
+    "decorator_pool_waiting", "Threads waiting for a pooled instance",
+    ("pool",))
+POOL_WAIT_SECONDS = REGISTRY.histogram(
+    "decorator_pool_wait_seconds", "Time spent waiting for a checkout",
+    ("pool",))
+POOL_TIMEOUTS = REGISTRY.counter(
+    "decorator_pool_timeouts", "Checkouts that gave up waiting", ("pool",))
+POOL_EVICTIONS = REGISTRY.counter(
+    "decorator_pool_evictions",
+    "Instances discarded because they were idle or unhealthy", ("pool",))
+
+
+class PoolTimeout(TimeoutError):
+    """Raised when no pooled instance became available in time"""
+
+
+class Pool:
+    """
+    Bounded, thread-safe pool of instances created on demand
+
+    Parameters:
+        factory (callable): creates a new instance
+        max_size (int): maximum number of instances alive at the same time
+        timeout (float): default maximum wait for a checkout in seconds
+                         (None waits forever)
+        health_check (callable): receives an idle instance before it is
+                                 handed out, instances for which it returns
+                                 False (or raises) are discarded
+        max_idle (float): discard instances idle for longer than this many
+                          seconds (optional)
+        name (str): name of the pool in the metrics
+    """
+
+    def __init__(self, factory: callable, max_size: int = 4,
+                 timeout: float = None, health_check: callable = None,
+                 max_idle: float = None, name: str = "pool"):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.factory = factory
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check = health_check
+        self.max_idle = max_idle
+        self.name = name
+        self._idle = deque()  # (instance, time it was checked in)
+        self._checked_out = {}  # id -> instance
+        self._size = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._created = 0
+        self._evicted = 0
+        self._timeouts = 0
+        self._cond = threading.Condition()
+        self._in_use_gauge = POOL_IN_USE.labels(name)
+        self._idle_gauge = POOL_IDLE.labels(name)
+        self._waiting_gauge = POOL_WAITING.labels(name)
+        self._wait_seconds = POOL_WAIT_SECONDS.labels(name)
+        self._timeout_counter = POOL_TIMEOUTS.labels(name)
+        self._eviction_counter = POOL_EVICTIONS.labels(name)
+
+    def _publish(self) -> None:
+        # Called with the condition held
+        self._in_use_gauge.set(self._in_use)
+        self._idle_gauge.set(len(self._idle))
+        self._waiting_gauge.set(self._waiting)
+
+    def _evict_idle(self) -> list:
+        # Called with the condition held, oldest instances are on the left
+        evicted = []
+        if self.max_idle is not None:
+            limit = time.monotonic() - self.max_idle
+            while self._idle and self._idle[0][1] < limit:
+                evicted.append(self._idle.popleft()[0])
+                self._size -= 1
+        return evicted
+
+    def _take(self, deadline: float):
+        """Return (instance, False) or (None, True) when one may be created"""
+        evicted = []
+        try:
+            with self._cond:
+                self._waiting += 1
+                try:
+                    while True:
+                        expired = self._evict_idle()
+                        if expired:
+                            evicted.extend(expired)
+                            self._cond.notify(len(expired))
+                        if self._idle:
+                            # Most recently used first, extra ones age out
+                            instance = self._idle.pop()[0]
+                            self._in_use += 1
+                            return instance, False
+                        if self._size < self.max_size:
+                            self._size += 1
+                            self._in_use += 1
+                            return None, True
+                        remaining = None
+                        if deadline is not None:
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0:
+                                self._timeouts += 1
+                                self._timeout_counter.inc()
+                                raise PoolTimeout(
+                                    f"No instance of '{self.name}' "
+                                    f"available in time")
+                        self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+                    self._publish()
+        finally:
+            # Closing may be slow, never do it while holding the lock
+            if evicted:
+                self._close(evicted)
+
+    def _close(self, instances: list) -> None:
+        with self._cond:
+            self._evicted += len(instances)
+        self._eviction_counter.inc(len(instances))
+        for instance in instances:
+            close = getattr(instance, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception:
+                    pass
+
+    def _healthy(self, instance) -> bool:
+        try:
+            return bool(self.health_check(instance))
+        except Exception:
+            return False
+
+    def checkout(self, timeout: float = -1):
+        """
+        Take an instance out of the pool, creating one if there is room
+
+        Parameters:
+            timeout (float): maximum wait in seconds (default: the pool's
+                             timeout, None waits forever)
+
+        Returns:
+            object: instance that must be given back with checkin()
+        """
+        if timeout == -1:
+            timeout = self.timeout
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        while True:
+            instance, create = self._take(deadline)
+            if create:
+                try:
+                    instance = self.factory()
+                except BaseException:
+                    self._forget()
+                    raise
+            elif self.health_check is not None and not self._healthy(
+                    instance):
+                self._forget()
+                self._close([instance])
+                continue
+            with self._cond:
+                if create:
+                    self._created += 1
+                self._checked_out[id(instance)] = instance
+            self._wait_seconds.observe(time.monotonic() - start)
+            return instance
+
+    def _release(self, instance) -> None:
+        # Called with the condition held: a second checkin of the same
+        # instance would hand it to two threads
+        if self._checked_out.pop(id(instance), None) is not instance:
+            raise ValueError(
+                f"{instance!r} is not checked out of '{self.name}'")
+
+    def checkin(self, instance) -> None:
+        """
+        Give back an instance taken with checkout()
+
+        Raises ValueError if the instance is not checked out of this pool,
+        for example when it was already given back.
+        """
+        with self._cond:
+            self._release(instance)
+            self._in_use -= 1
+            self._idle.append((instance, time.monotonic()))
+            self._publish()
+            self._cond.notify()
+
+    def discard(self, instance) -> None:
+        """Drop a broken instance taken with checkout() instead of giving
+        it back, a new one will be created when needed"""
+        with self._cond:
+            self._release(instance)
+        self._forget()
+        self._close([instance])
+
+    def _forget(self) -> None:
+        with self._cond:
+            self._size -= 1
+            self._in_use -= 1
+            self._publish()
+            self._cond.notify()
+
+    @contextmanager
+    def acquire(self, timeout: float = -1):
+        """
+        Context manager that checks an instance out and back in
+
+        Example:
+            with DatabaseConnection.pool.acquire() as db:
+                db.query("SELECT 1")
+        """
+        instance = self.checkout(timeout)
+        try:
+            yield instance
+        finally:
+            self.checkin(instance)
+
+    def stats(self) -> dict:
+        """Current state of the pool, saturation is in_use / max_size"""
+        with self._cond:
+            return {
+                "max_size": self.max_size,
+                "size": self._size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "waiting": self._waiting,
+                "created": self._created,
+                "evicted": self._evicted,
+                "timeouts": self._timeouts,
+                "saturation": self._in_use / self.max_size,
+            }
+
+    def close(self) -> None:
+        """Discard every idle instance"""
+        with self._cond:
+            idle = [instance for instance, _ in self._idle]
+            self._idle.clear()
+            self._size -= len(idle)
+            self._publish()
+        self._close(idle)
+
+
+def pooled(cls=None, *, max_size: int = 4, timeout: float = None,
+           health_check: callable = None, max_idle: float = None,
+           args: tuple = (), kwargs: dict = None):
+    """
+    Decorator that gives a class a bounded pool of shared instances
+
+    Where a singleton makes every thread share one instance, a pooled
+    class lets up to max_size threads work in parallel, each with its own
+    instance, without creating a new instance per call. The class itself is
+    left unchanged, the pool is available as cls.pool.
+
+    Parameters:
+        cls (class): class whose instances are pooled
+        max_size (int): maximum number of instances (default: 4)
+        timeout (float): maximum wait for a checkout in seconds
+                         (default: None, wait forever)
+        health_check (callable): receives an idle instance before it is
+                                 handed out, returns False if it is broken
+        max_idle (float): discard instances idle for longer than this many
+                          seconds (optional)
+        args (tuple): positional arguments used to create the instances
+        kwargs (dict): keyword arguments used to create the instances
+
+    Returns:
+        class: the class, with a pool attribute
+
+    Example:
+        @pooled(max_size=8, timeout=5)
+        class Connection:
+            ...
+
+        with Connection.pool.acquire() as connection:
+            ...
+    """
+    def decorator(cls):
+        cls.pool = Pool(lambda: cls(*args, **(kwargs or {})),
+                        max_size=max_size, timeout=timeout,
+                        health_check=health_check, max_idle=max_idle,
+                        name=function_label(cls))
+        return cls
+
+    if cls is not None:
+        return decorator(cls)
+    return decorator
+
+
+if __name__ == "__main__":
+    ###########################################################################
+    # Here's a generic example of how to use the decorator ####################
+    ###########################################################################
+
+    # First: define a class that you want to make a singleton
+    # Second: use @singleton before the class definition
+
+    # General structure of the class that you want to decorate with singleton
+    @singleton
+    class YourClass:  # This class will be a singleton
+        def __init__(self):
+            ...  # Your initialization code here
+            self.attribute = "value"  # Your attributes here
+
+    # General structure of a class whose instances are pooled
+    @pooled(max_size=4, timeout=5.0)
+    class YourPooledClass:  # Up to 4 instances, used by 4 threads at once
+        def __init__(self):
+            ...  # Your initialization code here
+
+    # with YourPooledClass.pool.acquire() as instance:
+    #     ...  # Use the instance, it goes back to the pool afterwards
+
+    ###########################################################################
+    # Sample classes to test the singleton decorator ##########################
+    ###########################################################################
+
+    @singleton
+    class DatabaseConnection:
+        """Singleton database connection"""
+
+        def __init__(self):
+            print("Initializing database connection...")
+            self.connection_string = "postgresql://localhost:5432/mydb"
+            self.connected = True
+
+        def query(self, sql: str):
+            return f"Executing: {sql}"
+
+    @singleton
+    class ConfigManager:
+        """Singleton configuration manager"""
+
+        def __init__(self):
+            print("Loading configuration...")
+            self.settings = {
+                "debug": True,
+                "max_connections": 100,
+                "timeout": 30
+            }
+
+        def get(self, key: str):
+            return self.settings.get(key)
+
+        def set(self, key: str, value):
+            self.settings[key] = value
+
+    @singleton(key=lambda host, port=5432: (host, port),
+               warmup=["localhost"])
+    class ConnectionPerHost:
+        """One connection per (host, port), localhost is connected at import"""
+
+        def __init__(self, host: str, port: int = 5432):
+            print(f"Connecting to {host}:{port}...")
+            self.host = host
+            self.port = port
+
+    @singleton
+    class Logger:
+        """Singleton logger"""
+
+        def __init__(self):
+            print("Initializing logger...")
+            self.logs = []
+
+        def log(self, message: str):
+            self.logs.append(message)
+            print(f"LOG: {message}")
+
+        def get_logs(self):
+            return self.logs
+
+    # Test the decorator
+    print("=== Testing DatabaseConnection ===")
+    db1 = DatabaseConnection()
+    db2 = DatabaseConnection()
+    print(f"db1 is db2: {db1 is db2}")  # Should be True
+    print(db1.query("SELECT * FROM users"))
+
+    print("\n=== Testing ConfigManager ===")
+    config1 = ConfigManager()
+    config2 = ConfigManager()
+    print(f"config1 is config2: {config1 is config2}")  # Should be True
+    config1.set("debug", False)
+    print(f"config2.get('debug'): {config2.get('debug')}")  # Should be False
+
+    print("\n=== Testing Logger ===")
+    logger1 = Logger()
+    logger2 = Logger()
+    print(f"logger1 is logger2: {logger1 is logger2}")  # Should be True
+    logger1.log("First message")
+    logger2.log("Second message")
+    print(f"Total logs: {len(logger1.get_logs())}")  # Should be 2
+
+    print("\n=== Testing isinstance and subclassing ===")
+    print(f"isinstance(db1, DatabaseConnection): "
+          f"{isinstance(db1, DatabaseConnection)}")  # Should be True
+
+    class ReadOnlyConnection(DatabaseConnection):
+        """Subclasses are singletons too, with their own instance"""
+
+    ro1 = ReadOnlyConnection()
+    print(f"ro1 is ReadOnlyConnection(): {ro1 is ReadOnlyConnection()}")  # True
+    print(f"ro1 is db1: {ro1 is db1}")  # Should be False
+
+    print("\n=== Testing ConnectionPerHost ===")
+    local = ConnectionPerHost("localhost")  # Created at import, not again
+    remote = ConnectionPerHost("db.example.com")
+    print(f"local is remote: {local is remote}")  # Should be False
+    print(f"remote is ConnectionPerHost('db.example.com'): "
+          f"{remote is ConnectionPerHost('db.example.com')}")  # Should be True
+
+    print("\n=== Testing pooled ===")
+
+    @pooled(max_size=3, timeout=2.0, max_idle=60,
+            health_check=lambda connection: connection.connected)
+    class PooledConnection:
+        """Up to 3 connections used in parallel"""
+
+        def __init__(self):
+            self.connected = True
+
+        def query(self, sql: str):
+            time.sleep(0.1)
+            return f"Executing: {sql}"
+
+    def worker(n: int):
+        with PooledConnection.pool.acquire() as connection:
+            connection.query(f"SELECT {n}")
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(9)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # 9 queries of 0.1 seconds on 3 connections take about 0.3 seconds
+    print(f"9 queries took {time.perf_counter() - start:.2f} seconds")
+    print(PooledConnection.pool.stats())
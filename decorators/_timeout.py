@@ -0,0 +1,238 @@
+# ALL YOU NEED IS THE FOLLOWING CODE AND THE IMPORT STATEMENTS ################
+
+"""Useful information about the decorator:
+- The timeout decorator bounds how long a single call may run
+- A call that takes too long raises CallTimeoutError, a TimeoutError that
+  can be given to retry(exceptions=...) so a hung call gets retried
+- method="thread" runs the call in a daemon thread and stops waiting for
+  it: the caller gets its answer on time, but the call itself keeps running
+  in the background and its result is dropped
+- method="process" runs the call in a forked child process that is killed
+  when the time is up, the only way to really stop runaway CPU work. The
+  arguments and result must be picklable, and fork must be available
+  (Linux, macOS)
+- method="async" cancels a coroutine still running after the delay
+- method="auto" picks "async" for coroutine functions and "thread" for
+  the others
+"""
+
+import asyncio
+import contextvars
+import inspect
+import threading
+from functools import wraps
+
+from .metrics import REGISTRY, function_label
+
+
+TIMEOUT_EXPIRED = REGISTRY.counter(
+    "decorator_timeout_expired", "Calls stopped by timeout", ("function",))
+
+_METHODS = ("auto", "thread", "process", "async")
+
+# Seconds a timed out child process gets to exit before it is killed
+_TERMINATE_GRACE = 1.0
+
+
+class CallTimeoutError(TimeoutError):
+    """Raised when a call did not finish within its timeout"""
+
+
+def _inThread(func: callable, seconds: float, expired) -> callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        outcome = []
+
+        def target():
+            try:
+                outcome.append((True, func(*args, **kwargs)))
+            except BaseException as e:
+                outcome.append((False, e))
+
+        # The call sees the context variables of the caller
+        context = contextvars.copy_context()
+        thread = threading.Thread(target=context.run, args=(target,),
+                                  name=f"timeout-{func.__name__}",
+                                  daemon=True)
+        thread.start()
+        thread.join(seconds)
+        if thread.is_alive():
+            expired.inc()
+            raise CallTimeoutError(
+                f"{func.__name__} did not finish within {seconds} seconds")
+        succeeded, value = outcome[0]
+        if succeeded:
+            return value
+        raise value
+    return wrapper
+
+
+def _child(func: callable, sender, args: tuple, kwargs: dict) -> None:
+    # Runs in the forked process, sends (succeeded, result or exception)
+    try:
+        outcome = (True, func(*args, **kwargs))
+    except BaseException as e:
+        outcome = (False, e)
+    try:
+        sender.send(outcome)
+    except Exception as e:
+        sender.send((False, RuntimeError(
+            f"{func.__name__} returned a value that cannot be sent back to "
+            f"the caller: {e!r}")))
+    sender.close()
+
+
+def _stop(process) -> None:
+    """Terminate a child process, and kill it if it ignores SIGTERM"""
+    process.terminate()
+    process.join(_TERMINATE_GRACE)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def _inProcess(func: callable, seconds: float, expired) -> callable:
+    # Only needed by this method, not imported up front
+    import multiprocessing
+
+    # Fail when decorating rather than on the first call
+    if "fork" not in multiprocessing.get_all_start_methods():
+        raise ValueError("method='process' needs the fork start method, "
+                         "which is not available on this platform")
+    context = multiprocessing.get_context("fork")
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_child,
+                                  args=(func, sender, args, kwargs),
+                                  name=f"timeout-{func.__name__}",
+                                  daemon=True)
+        process.start()
+        sender.close()
+        try:
+            if not receiver.poll(seconds):
+                _stop(process)
+                expired.inc()
+                raise CallTimeoutError(
+                    f"{func.__name__} did not finish within {seconds} "
+                    "seconds and was terminated")
+            try:
+                succeeded, value = receiver.recv()
+            except EOFError:
+                process.join(_TERMINATE_GRACE)
+                raise ChildProcessError(
+                    f"{func.__name__} exited with code {process.exitcode} "
+                    "without returning") from None
+        finally:
+            receiver.close()
+            # The child exits right after sending, unless it is stuck
+            process.join(_TERMINATE_GRACE)
+            if process.is_alive():
+                _stop(process)
+        if succeeded:
+            return value
+        raise value
+    return wrapper
+
+
+def _inTask(func: callable, seconds: float, expired) -> callable:
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        # Not wait_for: a TimeoutError raised by the coroutine itself must
+        # not be mistaken for the timeout of this decorator
+        task = asyncio.ensure_future(func(*args, **kwargs))
+        try:
+            done, _ = await asyncio.wait((task,), timeout=seconds)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        if done:
+            return task.result()
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        expired.inc()
+        raise CallTimeoutError(
+            f"{func.__name__} did not finish within {seconds} seconds")
+    return wrapper
+
+
+def timeout(seconds: float, method: str = "auto") -> callable:
+    """
+    Decorator that raises CallTimeoutError when a call takes too long
+
+    Parameters:
+        seconds (float): maximum duration of a call
+        method (str): how the timeout is enforced, "thread", "process",
+                      "async" or "auto" (default: "auto")
+
+    Returns:
+        callable: decorator
+    """
+    if method not in _METHODS:
+        raise ValueError(f"method must be one of {_METHODS}")
+
+    def decorator(func: callable) -> callable:
+        expired = TIMEOUT_EXPIRED.labels(function_label(func))
+        isAsync = inspect.iscoroutinefunction(func)
+        chosen = method
+        if chosen == "auto":
+            chosen = "async" if isAsync else "thread"
+        if (chosen == "async") != isAsync:
+            raise ValueError(
+                "method='async' is only for coroutine functions, and "
+                "coroutine functions can only use method='async'")
+        if chosen == "thread":
+            return _inThread(func, seconds, expired)
+        if chosen == "process":
+            return _inProcess(func, seconds, expired)
+        return _inTask(func, seconds, expired)
+    return decorator
+
+
+if __name__ == "__main__":
+    import time
+
+    from . import retry
+
+    ###########################################################################
+    # Here's a generic example of how to use the decorator ####################
+    ###########################################################################
+
+    @retry(attempts=3, delay=0, exceptions=(CallTimeoutError,))
+    @timeout(5.0)
+    def YourFunction(n):  # Each attempt may take at most 5 seconds
+        ...  # Your code here
+        return n  # Return the result of the function if needed
+
+    ###########################################################################
+    # Sample functions to test the timeout decorator ##########################
+    ###########################################################################
+
+    @timeout(0.1)
+    def hangs():
+        time.sleep(1)  # Keeps running in its thread after the timeout
+
+    @timeout(0.1, method="process")
+    def spins():
+        while True:  # Runaway CPU work, the child process is killed
+            pass
+
+    @timeout(0.1)
+    async def waits():
+        await asyncio.sleep(1)  # Cancelled after 0.1 seconds
+
+    for function in (hangs, spins, lambda: asyncio.run(waits())):
+        try:
+            function()
+        except CallTimeoutError as e:
+            print(e)
+
+    @timeout(1.0, method="process")
+    def square(n: int) -> int:
+        return n * n
+
+    print(square(12))  # 144
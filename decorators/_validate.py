@@ -0,0 +1,525 @@
+# ############# ALL YOU NEED IS THE FOLLOWING FUNCTION ########################
+
+"""Useful information about the decorator:
+- The validate decorator validates function arguments against custom conditions
+- Useful for input validation, data sanitization, and enforcing constraints
+- Can validate ranges, types, patterns, and custom conditions
+- Raises ValueError with descriptive messages on validation failure
+- Declarative constraints (Range, OneOf, Matches, Vectorized) check whole
+  lists or NumPy arrays in one pass and report the offending indices
+"""
+
+import inspect
+import re
+import sys
+from functools import wraps
+from typing import Callable, Any
+
+
+# Global switch, see set_validation()
+_enabled = True
+
+_POSITIONAL = (inspect.Parameter.POSITIONAL_ONLY,
+               inspect.Parameter.POSITIONAL_OR_KEYWORD)
+_VARIADIC = (inspect.Parameter.VAR_POSITIONAL,
+             inspect.Parameter.VAR_KEYWORD)
+
+
+def _numpy():
+    """NumPy, if it has been imported (arrays can only come from it)"""
+    return sys.modules.get("numpy")
+
+
+class BatchValidationError(ValueError):
+    """
+    Raised when some elements of a sequence or array fail a Constraint
+
+    Attributes:
+        name (str): name of the validated parameter
+        indices (list | numpy.ndarray): indices of the offending elements
+    """
+
+    def __init__(self, name: str, indices):
+        self.name = name
+        self.indices = indices
+        shown = [_plain(i) for i in indices[:10]]
+        more = ", ..." if len(indices) > 10 else ""
+        super().__init__(
+            f"Validation failed for '{name}' at {len(indices)} "
+            f"indices: [{', '.join(map(str, shown))}{more}]"
+        )
+
+
+def _plain(index):
+    # NumPy integers and index arrays read better as plain Python values
+    np = _numpy()
+    if np is not None and isinstance(index, np.ndarray):
+        return tuple(int(i) for i in index)
+    return int(index)
+
+
+def _is_batch(value: Any) -> bool:
+    """Whether a Constraint should check value element by element"""
+    np = _numpy()
+    if isinstance(value, (list, tuple, range)):
+        return True
+    if np is None or isinstance(value, (str, bytes, np.generic)):
+        # NumPy scalars have __array__ too, but hold a single value
+        return False
+    return hasattr(value, "__array__") and np.ndim(value) > 0
+
+
+def _mask_indices(invalid) -> Any:
+    """Indices of the True values of a boolean mask"""
+    np = _numpy()
+    if invalid.ndim == 1:
+        return np.flatnonzero(invalid)
+    return np.argwhere(invalid)
+
+
+class Constraint:
+    """
+    Base class of the declarative validators
+
+    A constraint works as a normal validator on a single value, and checks
+    a whole list, tuple or NumPy array in one pass when the argument is one,
+    reporting the indices of the elements that fail.
+    """
+
+    def __call__(self, value: Any) -> bool:
+        raise NotImplementedError
+
+    def invalid(self, values) -> Any:
+        """Return the indices of the elements of values that fail"""
+        np = _numpy()
+        if np is not None and not isinstance(values, (list, tuple, range)):
+            return _mask_indices(self._invalid_mask(np.asarray(values)))
+        check = self.__call__
+        return [i for i, value in enumerate(values) if not check(value)]
+
+    def _invalid_mask(self, array):
+        # Generic fallback, subclasses override it with array operations
+        np = _numpy()
+        check = self.__call__
+        return ~np.frompyfunc(check, 1, 1)(array).astype(bool)
+
+
+class Range(Constraint):
+    """
+    Values must lie between low and high (both inclusive, either optional)
+
+    Example:
+        @validate(ages=Range(0, 150))
+    """
+
+    def __init__(self, low=None, high=None):
+        self.low = low
+        self.high = high
+
+    def __call__(self, value: Any) -> bool:
+        if self.low is not None and not value >= self.low:
+            return False
+        return self.high is None or value <= self.high
+
+    def invalid(self, values) -> Any:
+        np = _numpy()
+        if np is not None and not isinstance(values, (list, tuple, range)):
+            return super().invalid(values)
+        low, high = self.low, self.high
+        if low is None and high is None:
+            return []
+        if low is None:
+            return [i for i, v in enumerate(values) if not v <= high]
+        if high is None:
+            return [i for i, v in enumerate(values) if not v >= low]
+        return [i for i, v in enumerate(values) if not low <= v <= high]
+
+    def _invalid_mask(self, array):
+        np = _numpy()
+        valid = np.ones(array.shape, dtype=bool)
+        # Written as "not valid" so that NaN is reported as invalid
+        if self.low is not None:
+            valid &= array >= self.low
+        if self.high is not None:
+            valid &= array <= self.high
+        return ~valid
+
+    def __repr__(self) -> str:
+        return f"Range({self.low!r}, {self.high!r})"
+
+
+class OneOf(Constraint):
+    """
+    Values must be one of the given choices
+
+    Example:
+        @validate(grades=OneOf("ABCDF"))
+    """
+
+    def __init__(self, choices):
+        self.choices = frozenset(choices)
+
+    def __call__(self, value: Any) -> bool:
+        return value in self.choices
+
+    def invalid(self, values) -> Any:
+        np = _numpy()
+        if np is not None and not isinstance(values, (list, tuple, range)):
+            return super().invalid(values)
+        choices = self.choices
+        return [i for i, v in enumerate(values) if v not in choices]
+
+    def _invalid_mask(self, array):
+        np = _numpy()
+        return ~np.isin(array, list(self.choices))
+
+    def __repr__(self) -> str:
+        return f"OneOf({sorted(self.choices, key=repr)!r})"
+
+
+class Matches(Constraint):
+    """
+    Values must be strings fully matching the regular expression
+
+    Example:
+        @validate(emails=Matches(r"[^@]+@[^@]+\.[^@]+"))
+    """
+
+    def __init__(self, pattern: str, flags: int = 0):
+        self.pattern = re.compile(pattern, flags)
+
+    def __call__(self, value: Any) -> bool:
+        return isinstance(value, str) and (
+            self.pattern.fullmatch(value) is not None)
+
+    def invalid(self, values) -> Any:
+        np = _numpy()
+        if np is not None and not isinstance(values, (list, tuple, range)):
+            values = np.asarray(values)
+            if values.ndim != 1:
+                return super().invalid(values)
+            values = values.tolist()
+        match = self.pattern.fullmatch
+        return [i for i, v in enumerate(values)
+                if not isinstance(v, str) or match(v) is None]
+
+    def __repr__(self) -> str:
+        return f"Matches({self.pattern.pattern!r})"
+
+
+class Vectorized(Constraint):
+    """
+    Predicate that takes a whole NumPy array and returns a boolean mask
+
+    Sequences are converted with numpy.asarray, a single value is checked
+    as a 0-d array. Requires NumPy.
+
+    Example:
+        @validate(prices=Vectorized(lambda a: np.isfinite(a) & (a > 0)))
+    """
+
+    def __init__(self, predicate: Callable[[Any], Any]):
+        # Vectorized constraints require NumPy, import it now
+        import numpy  # noqa: F401
+        self.predicate = predicate
+
+    def __call__(self, value: Any) -> bool:
+        np = _numpy()
+        return bool(np.all(self.predicate(np.asarray(value))))
+
+    def invalid(self, values) -> Any:
+        np = _numpy()
+        return super().invalid(np.asarray(values))
+
+    def _invalid_mask(self, array):
+        np = _numpy()
+        return ~np.asarray(self.predicate(array), dtype=bool)
+
+    def __repr__(self) -> str:
+        return f"Vectorized({self.predicate!r})"
+
+
+def set_validation(enabled: bool) -> None:
+    """
+    Turn argument validation on or off for every validated function
+
+    While validation is off, decorated functions skip their checks, and
+    functions decorated while it is off are returned unchanged, so trusted
+    hot paths pay nothing for it.
+
+    Parameters:
+        enabled (bool): True to validate arguments, False to skip it
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def _compile(func: callable, validators: dict) -> tuple:
+    """
+    Work out once where each validated argument is found in a call
+
+    Returns a tuple of (name, position, keyword, default, validator,
+    check), where check runs the validator on the value, or None when a
+    validator targets *args or **kwargs and the arguments have to be bound
+    with the signature instead.
+    """
+    sig = inspect.signature(func)
+    plan = []
+    for position, (name, param) in enumerate(sig.parameters.items()):
+        if name not in validators:
+            continue
+        if param.kind in _VARIADIC:
+            return None
+        plan.append((
+            name,
+            position if param.kind in _POSITIONAL else None,
+            None if param.kind == param.POSITIONAL_ONLY else name,
+            param.default,
+            validators[name],
+            _check_constraint if isinstance(validators[name], Constraint)
+            else _check,
+        ))
+    return tuple(plan)
+
+
+def _check(name: str, validator: callable, value: Any) -> None:
+    # Run the validator
+    try:
+        is_valid = validator(value)
+    except Exception as e:
+        raise ValueError(
+            f"Error validating '{name}': {e}"
+        )
+
+    if not is_valid:
+        raise ValueError(
+            f"Validation failed for '{name}' "
+            f"with value: {value}"
+        )
+
+
+def _check_constraint(name: str, constraint: Constraint,
+                      value: Any) -> None:
+    if not _is_batch(value):
+        np = _numpy()
+        if np is not None and isinstance(value, np.ndarray):
+            # 0-d array: check the scalar it holds
+            value = value[()]
+        _check(name, constraint, value)
+        return
+    try:
+        indices = constraint.invalid(value)
+    except Exception as e:
+        raise ValueError(
+            f"Error validating '{name}': {e}"
+        )
+    if len(indices):
+        raise BatchValidationError(name, indices)
+
+
+def _check_bound(sig: inspect.Signature, validators: dict, args: tuple,
+                 kwargs: dict) -> None:
+    """Validate a call by binding it to the signature"""
+    bound_args = sig.bind(*args, **kwargs)
+    bound_args.apply_defaults()
+    for param_name, validator in validators.items():
+        if param_name in bound_args.arguments:
+            check = (_check_constraint if isinstance(validator, Constraint)
+                     else _check)
+            check(param_name, validator, bound_args.arguments[param_name])
+
+
+def _fusion_lines(plan: tuple, namespace: dict) -> list:
+    """
+    Write out the lookup of each validated argument as source code, for
+    compose(): no loop over the plan and no tuple unpacking per call
+    """
+    empty = inspect.Parameter.empty
+    lines = ["if {p}module._enabled:", "    {p}count = len(args)"]
+    for i, (name, position, keyword, default, validator,
+            check) in enumerate(plan):
+        namespace[f"validator{i}"] = validator
+        namespace[f"check{i}"] = check
+        branches = []
+        if position is not None:
+            branches.append((f"{{p}}count > {position}", f"args[{position}]"))
+        if keyword is not None:
+            branches.append((f"{keyword!r} in kwargs",
+                             f"kwargs[{keyword!r}]"))
+        if default is not empty:
+            namespace[f"default{i}"] = default
+            branches.append((None, f"{{p}}default{i}"))
+        for j, (condition, value) in enumerate(branches):
+            call = f"{{p}}check{i}({name!r}, {{p}}validator{i}, {value})"
+            if condition is None and j == 0:
+                lines.append(f"    {call}")
+            elif condition is None:
+                lines += ["    else:", f"        {call}"]
+            else:
+                keyword_ = "if" if j == 0 else "elif"
+                lines += [f"    {keyword_} {condition}:", f"        {call}"]
+    return lines + ["{inner}"]
+
+
+def validate(**validators: Callable[[Any], bool]) -> callable:
+    """
+    Decorator that validates function arguments using custom validators
+
+    This decorator checks arguments against validation functions before
+    executing the decorated function. Each validator should return True
+    if the argument is valid, False otherwise.
+
+    The signature is inspected once, when the function is decorated, so
+    each call only reads the validated arguments from args and kwargs.
+    Use set_validation(False) to skip validation globally.
+
+    Validators can also be Constraint objects (Range, OneOf, Matches,
+    Vectorized): a list, tuple or array argument is then checked element
+    by element in one pass, and BatchValidationError (a ValueError) lists
+    the indices of the elements that fail.
+
+    Parameters:
+        validators (dict): keyword arguments mapping parameter names to
+                          validation functions
+
+    Returns:
+        callable: decorated function with argument validation
+
+    Example:
+        @validate(age=lambda x: x >= 0, name=lambda x: len(x) > 0)
+        def create_user(name, age):
+            return f"User {name}, age {age}"
+    """
+    def decorator(func: callable) -> callable:
+        if not _enabled:
+            return func
+
+        plan = _compile(func, validators)
+        empty = inspect.Parameter.empty
+
+        if plan is None:
+            # Validators on *args or **kwargs: bind the call
+            sig = inspect.signature(func)
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if _enabled:
+                    _check_bound(sig, validators, args, kwargs)
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _enabled:
+                count = len(args)
+                for (name, position, keyword, default, validator,
+                     check) in plan:
+                    if position is not None and position < count:
+                        value = args[position]
+                    elif keyword is not None and keyword in kwargs:
+                        value = kwargs[keyword]
+                    elif default is not empty:
+                        value = default
+                    else:
+                        # Missing argument, the call below raises TypeError
+                        continue
+                    check(name, validator, value)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    def fusion(func: callable) -> tuple:
+        # Steps of validate, run inline by compose() in a fused wrapper
+        if not _enabled:
+            return ["{inner}"], {}
+        namespace = {"module": sys.modules[__name__]}
+        plan = _compile(func, validators)
+        if plan is None:
+            namespace.update(check=_check_bound, validators=validators,
+                             sig=inspect.signature(func))
+            return ["if {p}module._enabled:",
+                    "    {p}check({p}sig, {p}validators, args, kwargs)",
+                    "{inner}"], namespace
+        return _fusion_lines(plan, namespace), namespace
+
+    decorator._fusion = fusion
+    return decorator
+
+
+if __name__ == "__main__":
+    ###########################################################################
+    # Here's a generic example of how to use the decorator ####################
+    ###########################################################################
+
+    # First: define validation functions for your parameters
+    # Second: use @validate with parameter_name=validation_function pairs
+
+    # General structure of the function that you want to decorate with validate
+    @validate(n=lambda x: x > 0)  # Validate that n is positive
+    def YourFunction(n):  # This function will have validated arguments
+        ...  # Your code here
+        return n  # Return the result of the function if needed
+
+    ###########################################################################
+    # Sample function to test the validate decorator ##########################
+    ###########################################################################
+
+    @validate(
+        age=lambda x: 0 <= x <= 150,
+        name=lambda x: len(x) > 0 and len(x) < 50
+    )
+    def create_user(name: str, age: int) -> str:
+        """Create a user with validated inputs"""
+        return f"Created user: {name}, age {age}"
+
+    @validate(
+        price=lambda x: x > 0,
+        quantity=lambda x: x > 0 and x == int(x)
+    )
+    def calculate_total(price: float, quantity: int) -> float:
+        """Calculate total cost with validation"""
+        return price * quantity
+
+    @validate(
+        email=lambda x: '@' in x and '.' in x,
+        password=lambda x: len(x) >= 8
+    )
+    def register(email: str, password: str) -> str:
+        """Register user with validated credentials"""
+        return f"Registered: {email}"
+
+    @validate(
+        score=lambda x: 0 <= x <= 100,
+        grade=lambda x: x in ['A', 'B', 'C', 'D', 'F']
+    )
+    def record_grade(student: str, score: int, grade: str) -> str:
+        """Record student grade with validation"""
+        return f"{student}: {score} ({grade})"
+
+    @validate(
+        ages=Range(0, 150),
+        grades=OneOf(['A', 'B', 'C', 'D', 'F']),
+        emails=Matches(r"[^@]+@[^@]+\.[^@]+")
+    )
+    def import_students(ages: list, grades: list, emails: list) -> int:
+        """Import a batch of students, every element is validated"""
+        return len(ages)
+
+    # Test the decorator
+    print(create_user("John Doe", 30))  # Valid
+    print(calculate_total(10.5, 3))  # Valid
+    print(register("user@example.com", "securepass123"))  # Valid
+    print(record_grade("Alice", 95, "A"))  # Valid
+    print(import_students([12, 14], ['A', 'C'], ["a@b.io", "c@d.io"]))  # Valid
+
+    try:
+        import_students([12, -1, 14, 200], ['A'] * 4, ["a@b.io"] * 4)
+    except BatchValidationError as e:
+        print(e)  # Validation failed for 'ages' at 2 indices: [1, 3]
+
+    # Uncomment to test validation failures:
+    # print(create_user("", 30))  # Fails: empty name
+    # print(calculate_total(-10, 3))  # Fails: negative price
+    # print(register("invalid-email", "pass"))  # Fails: invalid email and short password
+    # print(record_grade("Bob", 150, "A"))  # Fails: score out of range
@@ -4,12 +4,13 @@
  - The decorator caches the results of a function on disk
  - The decorator saves the results of the function to a pkl file (binary file)
  - The decorator is useful if you have a function that takes a long time to run
+ - The cache is reachable with func.cache_get(args, kwargs) and
+   func.cache_put(args, kwargs, value)
 '''
 
 
 import os
 import pickle
-import time
 from functools import wraps
 
 
@@ -23,55 +24,71 @@ def diskCache(cacheDir: str = "cache") -> callable:
     Returns:
         callable: decorated function
     """
-    # Create the cache directory if it does not exist
-    if not os.path.exists(cacheDir):
-        os.makedirs(cacheDir)
-
     def decorator(func: callable) -> callable:
-        @wraps(func)
-        def wrapper(*args, **kwargs):
+        def cachePath(args: tuple, kwargs: dict) -> str:
             # Create a unique key for the function call
             cacheKey = f"{func.__name__}_{args}_{kwargs}.pkl"
             # Create a path for the cache file
-            cachePath = os.path.join(cacheDir, cacheKey)
+            return os.path.join(cacheDir, cacheKey)
+
+        def cache_get(args: tuple, kwargs: dict = None) -> tuple:
+            """Return (found, value) for the call func(*args, **kwargs)"""
+            path = cachePath(args, kwargs or {})
             # Check if the cache file exists
-            if os.path.exists(cachePath):
-                with open(cachePath, 'rb') as f:
-                    return pickle.load(f)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    return True, pickle.load(f)
+            return False, None
+
+        def cache_put(args: tuple, kwargs: dict, value) -> None:
+            """Store value as the result of func(*args, **kwargs)"""
+            # The cache directory is only created when the first result
+            # is stored
+            os.makedirs(cacheDir, exist_ok=True)
+            with open(cachePath(args, kwargs or {}), 'wb') as f:
+                pickle.dump(value, f)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            found, result = cache_get(args, kwargs)
+            if found:
+                return result
             # If the cache file does not exist, call the function
             result = func(*args, **kwargs)
             # Save the result to the cache file
-            with open(cachePath, 'wb') as f:
-                pickle.dump(result, f)
+            cache_put(args, kwargs, result)
             return result
+
+        # Lets other decorators (parallelMap) read and fill the cache
+        wrapper.cache_get = cache_get
+        wrapper.cache_put = cache_put
         return wrapper
     return decorator
 
 
-###############################################################################
-# Generic example of how to use the decorator #################################
-###############################################################################
-
-
-@diskCache()  # Decorate your function with the diskCache decorator
-def yourFunctionName(arg):  # Define your function here
-    ...  # Your function code here
-    return arg  # Return the result if needed
-
+if __name__ == "__main__":
+    import time
 
-###############################################################################
-# Simple of how to use the decorator ##########################################
-###############################################################################
+    ###########################################################################
+    # Generic example of how to use the decorator #############################
+    ###########################################################################
 
+    @diskCache()  # Decorate your function with the diskCache decorator
+    def yourFunctionName(arg):  # Define your function here
+        ...  # Your function code here
+        return arg  # Return the result if needed
 
-@diskCache()
-def expensiveComputation(x):
-    time.sleep(2)
-    return x * x
+    ###########################################################################
+    # Simple of how to use the decorator ######################################
+    ###########################################################################
 
+    @diskCache()
+    def expensiveComputation(x):
+        time.sleep(2)
+        return x * x
 
-# Test the decorator
-print(expensiveComputation(4))  # takes 2 seconds
-print(expensiveComputation(4))  # returns immediately
+    # Test the decorator
+    print(expensiveComputation(4))  # takes 2 seconds
+    print(expensiveComputation(4))  # returns immediately
 
-###############################################################################
+    ###########################################################################
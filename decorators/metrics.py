@@ -0,0 +1,401 @@
+# ALL YOU NEED IS THE FOLLOWING CODE AND THE IMPORT STATEMENTS ################
+
+"""Useful information about the metrics registry:
+- Central place where the decorators report what they measure (timings,
+  cache hits, throttles, retry attempts, ...)
+- Counters, gauges and histograms with labels, updated under a short
+  per-metric lock so reporting stays cheap on the hot path
+- Exports everything in the OpenMetrics text format, either served on a
+  local HTTP port or written to a file periodically
+- Existing Prometheus/OpenMetrics scrapers can collect the values directly
+  without parsing the printed logs
+"""
+
+import math
+import os
+import threading
+
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05,
+                   0.1, 0.5, 1.0, 5.0, 10.0, math.inf)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value as required by the OpenMetrics text format"""
+    return (value.replace("\\", "\\\\")
+                 .replace("\n", "\\n")
+                 .replace('"', '\\"'))
+
+
+def function_label(func) -> str:
+    """
+    Label value naming a decorated function (or class)
+
+    The module and the qualified name, so that functions with the same
+    name in different modules or classes get their own series.
+    """
+    module = getattr(func, "__module__", None)
+    name = getattr(func, "__qualname__", None) or getattr(
+        func, "__name__", repr(func))
+    return f"{module}.{name}" if module else name
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    """Base class shared by every metric family"""
+
+    kind = "unknown"
+
+    def __init__(self, name: str, documentation: str = "",
+                 labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values, **kwvalues):
+        """Return the child metric for the given label values"""
+        if kwvalues:
+            values = tuple(kwvalues[name] for name in self.labelnames)
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"Metric '{self.name}' expects labels {self.labelnames}")
+        # Fast path: the child already exists, no lock needed to read it
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._new_child()
+                    self._children[values] = child
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _default(self):
+        return self.labels()
+
+    def expose(self) -> list:
+        """Return the OpenMetrics text lines for this metric family"""
+        lines = []
+        if self.documentation:
+            lines.append(f"# HELP {self.name} {_escape(self.documentation)}")
+        lines.append(f"# TYPE {self.name} {self.kind}")
+        for values, child in list(self._children.items()):
+            lines.extend(child.expose(self.name, self.labelnames, values))
+        return lines
+
+
+class _CounterChild:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def expose(self, name, labelnames, values):
+        labels = _format_labels(labelnames, values)
+        return [f"{name}_total{labels} {_format_value(self._value)}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter (exported with the _total suffix)"""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+
+class _GaugeChild:
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self._value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def expose(self, name, labelnames, values):
+        labels = _format_labels(labelnames, values)
+        return [f"{name}{labels} {_format_value(self._value)}"]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._default().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default().dec(amount)
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "_counts", "_sum", "_count", "_lock")
+
+    def __init__(self, bounds: tuple):
+        self._bounds = bounds
+        self._counts = [0] * len(bounds)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        # Find the bucket outside of the lock, only the update is guarded
+        for index, bound in enumerate(self._bounds):
+            if value <= bound:
+                break
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def expose(self, name, labelnames, values):
+        with self._lock:
+            counts = list(self._counts)
+            total, count = self._sum, self._count
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self._bounds, counts):
+            cumulative += bucket_count
+            le = 'le="' + _format_value(float(bound)) + '"'
+            labels = _format_labels(labelnames, values, le)
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        labels = _format_labels(labelnames, values)
+        lines.append(f"{name}_count{labels} {count}")
+        lines.append(f"{name}_sum{labels} {_format_value(total)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str = "",
+                 labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        bounds = tuple(sorted(float(b) for b in buckets))
+        if not bounds or bounds[-1] != math.inf:
+            bounds += (math.inf,)
+        self.buckets = bounds
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+
+class MetricsRegistry:
+    """
+    Collection of metric families that can be exported together
+
+    Registering a metric twice with the same name returns the existing
+    metric, so decorators can declare what they need at decoration time
+    without coordinating with each other.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name, documentation, labelnames, **options):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = cls(name, documentation, labelnames, **options)
+                    self._metrics[name] = metric
+        if not isinstance(metric, cls):
+            raise ValueError(
+                f"Metric '{name}' is already registered as {metric.kind}")
+        return metric
+
+    def counter(self, name: str, documentation: str = "",
+                labelnames: tuple = ()) -> Counter:
+        """Return the counter called name, creating it if needed"""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str = "",
+              labelnames: tuple = ()) -> Gauge:
+        """Return the gauge called name, creating it if needed"""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str = "",
+                  labelnames: tuple = (),
+                  buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        """Return the histogram called name, creating it if needed"""
+        return self._register(Histogram, name, documentation, labelnames,
+                              buckets=buckets)
+
+    def get(self, name: str):
+        """Return the metric called name or None"""
+        return self._metrics.get(name)
+
+    def clear(self) -> None:
+        """Forget every registered metric"""
+        with self._lock:
+            self._metrics.clear()
+
+    def exposition(self) -> str:
+        """Render every metric in the OpenMetrics text format"""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.expose())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9464, addr: str = "127.0.0.1"):
+        """
+        Serve the metrics over HTTP from a background daemon thread
+
+        Parameters:
+            port (int): local port to listen on (0 picks a free port)
+            addr (str): address to bind to
+
+        Returns:
+            ThreadingHTTPServer: running server, call shutdown() to stop it
+        """
+        # Imported here so that using the registry does not pay for it
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = registry.exposition().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((addr, port), Handler)
+        thread = threading.Thread(target=server.serve_forever,
+                                  name="metrics-http", daemon=True)
+        thread.start()
+        return server
+
+    def write_to_file(self, path: str) -> None:
+        """Write the exposition to path atomically"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.exposition())
+        os.replace(tmp_path, path)
+
+    def write_periodically(self, path: str,
+                           interval: float = 15.0) -> threading.Event:
+        """
+        Write the exposition to path every interval seconds
+
+        Parameters:
+            path (str): file to write (e.g. for the node exporter textfile
+                        collector)
+            interval (float): seconds between writes
+
+        Returns:
+            threading.Event: set it to stop the background writer
+        """
+        stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                self.write_to_file(path)
+            self.write_to_file(path)
+
+        threading.Thread(target=run, name="metrics-writer",
+                         daemon=True).start()
+        return stop
+
+
+# Default registry the decorators report into
+REGISTRY = MetricsRegistry()
+
+
+###############################################################################
+# Simple example of how to use the registry ###################################
+###############################################################################
+
+
+if __name__ == "__main__":
+    import time
+
+    requests = REGISTRY.counter("example_requests", "Handled requests",
+                                ("status",))
+    latency = REGISTRY.histogram("example_latency_seconds", "Request latency")
+
+    for status in ("ok", "ok", "error"):
+        start = time.perf_counter()
+        requests.labels(status).inc()
+        latency.observe(time.perf_counter() - start)
+
+    print(REGISTRY.exposition())
+
+###############################################################################
@@ -1,5 +1,41 @@
 # ############# ALL YOU NEED IS THE FOLLOWING FUNCTION ########################
 import time
+from functools import wraps
+
+from .metrics import REGISTRY, function_label
+
+
+# Every timed call is also reported here so it can be scraped
+TIMER_SECONDS = REGISTRY.histogram(
+    "decorator_timer_seconds", "Runtime of functions decorated with timer",
+    ("function",))
+
+
+def _reporter(func: callable, timeUnit: str = "secondes") -> callable:
+    """Return the function that records and prints the runtime of func"""
+    seconds = TIMER_SECONDS.labels(function_label(func))
+
+    def report(timeTaken: float) -> None:
+        seconds.observe(timeTaken)
+        if timeUnit == "secondes":
+            print(f"{func.__name__} took {timeTaken} seconds to run.")
+        elif timeUnit == "minutes":
+            print(f"{func.__name__} took {timeTaken/60} minutes to run.")
+        elif timeUnit == "hours":
+            print(f"{func.__name__} took {timeTaken/3600} hours to run.")
+    return report
+
+
+def _timerFusion(timeUnit: str) -> callable:
+    """Steps of the timer, run inline by compose() in a fused wrapper"""
+    def fusion(func: callable) -> tuple:
+        lines = [
+            "{p}startTime = {p}time()",
+            "{inner}",
+            "{p}report({p}time() - {p}startTime)",
+        ]
+        return lines, {"time": time.time, "report": _reporter(func, timeUnit)}
+    return fusion
 
 
 def timer(func: callable) -> callable:
@@ -14,6 +50,9 @@ def timer(func: callable) -> callable:
     Returns:
         callable: decorated function
     """
+    report = _reporter(func)
+
+    @wraps(func)
     def wrapper(*args, **kwargs):
         # Start the timer
         startTime = time.time()
@@ -21,42 +60,14 @@ def timer(func: callable) -> callable:
         result = func(*args, **kwargs)
         # End the timer
         endTime = time.time()
-        # Print the time taken
-        print(f"{func.__name__} took {endTime - startTime} seconds to run.")
+        # Record and print the time taken
+        report(endTime - startTime)
         # Return the result
         return result
     return wrapper
 
 
-###############################################################################
-# Here's a generic example of how to use the decorator ########################
-###############################################################################
-
-
-# First: define a function that you want to decorate with timer
-# Second: use @timer before the function you want to decorate
-
-# General structure of the function that you want to decorate with timer
-@timer
-def YourFunction(n):  # This function will be decorated with timer
-    ...  # Your code here
-    return n  # Return the result of the function if needed
-
-
-###############################################################################
-# Sample function to test the timer decorator #################################
-###############################################################################
-
-
-@timer
-def sleeping(n: int) -> None:
-    time.sleep(n)
-    return None
-
-
-# The output of the following codes will be almost 1 second and 3 seconds
-sleeping(1)
-sleeping(3)
+timer._fusion = _timerFusion("secondes")
 
 
 ###############################################################################
@@ -66,35 +77,58 @@ sleeping(3)
 
 def timerCount(timeUnit: str = "secondes"):
     def decorator(func: callable):
+        report = _reporter(func, timeUnit)
+
+        @wraps(func)
         def wrapper(*args, **kwargs):
             startTime = time.time()
             result = func(*args, **kwargs)
             endTime = time.time()
-            timeTaken = endTime - startTime
-            if timeUnit == "secondes":
-                print(f"{func.__name__} took {timeTaken} seconds to run.")
-            elif timeUnit == "minutes":
-                print(f"{func.__name__} took {timeTaken/60} minutes to run.")
-            elif timeUnit == "hours":
-                print(f"{func.__name__} took {timeTaken/3600} hours to run.")
+            report(endTime - startTime)
             return result
         return wrapper
+
+    decorator._fusion = _timerFusion(timeUnit)
     return decorator
 
 
-###############################################################################
-# Sample function to test the timer decorator with parameter ##################
-###############################################################################
+if __name__ == "__main__":
+    ###########################################################################
+    # Here's a generic example of how to use the decorator ####################
+    ###########################################################################
 
+    # First: define a function that you want to decorate with timer
+    # Second: use @timer before the function you want to decorate
 
-@timerCount(timeUnit="minutes")
-def sleeping(n: int) -> None:
-    time.sleep(n)
-    return None
+    # General structure of the function that you want to decorate with timer
+    @timer
+    def YourFunction(n):  # This function will be decorated with timer
+        ...  # Your code here
+        return n  # Return the result of the function if needed
 
+    ###########################################################################
+    # Sample function to test the timer decorator #############################
+    ###########################################################################
 
-sleeping(1)
-sleeping(60)
+    @timer
+    def sleeping(n: int) -> None:
+        time.sleep(n)
+        return None
 
+    # The output of the following codes will be almost 1 second and 3 seconds
+    sleeping(1)
+    sleeping(3)
 
-###############################################################################
+    ###########################################################################
+    # Sample function to test the timer decorator with parameter ##############
+    ###########################################################################
+
+    @timerCount(timeUnit="minutes")
+    def sleeping(n: int) -> None:
+        time.sleep(n)
+        return None
+
+    sleeping(1)
+    sleeping(60)
+
+    ###########################################################################